@@ -4,16 +4,9 @@ Optimized for Streamlit Community Cloud
 """
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-from pathlib import Path
-import json
-import io
-from datetime import datetime
-from typing import Dict, List, Optional
+import copy
+import importlib
 import logging
-import sys
-import os
 
 # Set page config FIRST - before any other Streamlit commands
 st.set_page_config(
@@ -28,32 +21,166 @@ st.set_page_config(
     }
 )
 
-# Production logging configuration
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Custom CSS shared by every page
+_CUSTOM_CSS = """
+<style>
+.main-header {
+    background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+    padding: 2rem;
+    border-radius: 10px;
+    color: white;
+    margin-bottom: 2rem;
+    text-align: center;
+}
+
+.feature-card {
+    background: #f8f9fa;
+    padding: 1.5rem;
+    border-radius: 8px;
+    border-left: 4px solid #667eea;
+    margin: 1rem 0;
+}
+
+.metric-card {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 1rem;
+    border-radius: 8px;
+    text-align: center;
+    margin: 0.5rem 0;
+}
+
+.success-banner {
+    background: #d4edda;
+    border: 1px solid #c3e6cb;
+    color: #155724;
+    padding: 1rem;
+    border-radius: 5px;
+    margin: 1rem 0;
+}
+
+.warning-banner {
+    background: #fff3cd;
+    border: 1px solid #ffeaa7;
+    color: #856404;
+    padding: 1rem;
+    border-radius: 5px;
+    margin: 1rem 0;
+}
+
+.info-banner {
+    background: #d1ecf1;
+    border: 1px solid #bee5eb;
+    color: #0c5460;
+    padding: 1rem;
+    border-radius: 5px;
+    margin: 1rem 0;
+}
+
+/* Card rows rendered as one HTML block instead of st.columns */
+.features-grid {
+    display: grid;
+    grid-template-columns: repeat(3, 1fr);
+    gap: 1rem;
+}
+
+.metrics-grid {
+    display: grid;
+    grid-template-columns: repeat(4, 1fr);
+    gap: 1rem;
+}
+
+.info-grid {
+    display: grid;
+    grid-template-columns: repeat(2, 1fr);
+    gap: 1rem;
+}
+
+@media (max-width: 640px) {
+    .features-grid, .metrics-grid, .info-grid {
+        grid-template-columns: 1fr;
+    }
+}
+
+/* Hide default Streamlit elements */
+#MainMenu {visibility: hidden;}
+.stDeployButton {display: none;}
+footer {visibility: hidden;}
+.stApp > header {display: none;}
+</style>
+"""
+
+_SIDEBAR_LOGO_HTML = """
+<div style="text-align: center; padding: 1rem;">
+    <h1 style="color: #667eea;">📝 OMR System</h1>
+    <p style="color: #666;">v1.0.0 - Cloud Edition</p>
+</div>
+"""
+
+_FOOTER_HTML = """
+<hr>
+<div style="text-align: center; padding: 2rem; background: #f8f9fa; border-radius: 10px;">
+    <p style="margin: 0; color: #666;">
+        Built with ❤️ using <strong>Streamlit</strong> | 
+        <a href="https://github.com/your-username/omr-evaluation-system" target="_blank">GitHub</a> | 
+        <a href="mailto:support@your-domain.com">Support</a>
+    </p>
+    <p style="margin: 0.5rem 0 0 0; color: #999; font-size: 0.8rem;">
+        © 2025 OMR Evaluation System. Open source project for educational institutions.
+    </p>
+</div>
+"""
+
+# Page label -> (module, render function); each module is imported on first visit
+PAGES = {
+    "🏠 Home & Overview": ("views.home", "render"),
+    "📋 Create Exam Session": ("views.create_exam", "render"),
+    "🔑 Upload Answer Keys": ("views.answer_keys", "render"),
+    "📤 Process OMR Sheets": ("views.process_omr", "render"),
+    "📊 View Results & Analytics": ("views.results", "render"),
+    "📖 User Guide": ("views.user_guide", "render"),
+    "ℹ️ About & Support": ("views.about", "render")
+}
+
+# Session state keys and their initial values
+_SESSION_DEFAULTS = (
+    # Processed history, one list/array per result field (see views.process_omr)
+    ('results_cols', None),
+    # Running totals over results_cols, updated whenever results are added
+    ('result_stats', {'n': 0, 'sum_score': 0.0, 'sum_conf': 0.0, 'high': 0}),
+    ('current_exam', None),
+    ('current_page', "🏠 Home & Overview"),
+    ('answer_keys', None),
+    ('app_version', '1.0.0'),
+    ('deployment_mode', 'cloud')
 )
 
+@st.cache_resource
+def _get_logger() -> logging.Logger:
+    """Configure production logging once per process and return the app logger"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    return logging.getLogger("omr")
+
+def _sync_current_page():
+    """Copy the sidebar selection into current_page"""
+    st.session_state.current_page = st.session_state.current_page_nav
+
 class ProductionOMRApp:
     """Production-ready OMR Application for Streamlit Cloud"""
     
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
+        self.logger = _get_logger()
         self.initialize_session_state()
     
     def initialize_session_state(self):
         """Initialize all session state variables"""
-        session_defaults = {
-            'processed_results': [],
-            'current_exam': None,
-            'answer_keys': None,
-            'app_version': '1.0.0',
-            'deployment_mode': 'cloud'
-        }
-        
-        for key, default_value in session_defaults.items():
+        for key, default_value in _SESSION_DEFAULTS:
             if key not in st.session_state:
-                st.session_state[key] = default_value
+                # Copy so sessions never share a module-level default
+                st.session_state[key] = copy.copy(default_value)
     
     def run(self):
         """Main application entry point"""
@@ -70,91 +197,30 @@ class ProductionOMRApp:
             # Footer
             self.render_footer()
             
-        except Exception as e:
-            self.logger.error(f"Application error: {str(e)}")
-            st.error(f"Application error: {str(e)}")
+        except Exception:
+            # Full traceback goes to the server log; the browser gets a short notice
+            self.logger.exception("Application error")
+            st.error("Something went wrong on this page. Please refresh and try again.")
     
     def inject_custom_css(self):
         """Inject custom CSS for better UI"""
-        st.markdown("""
-        <style>
-        .main-header {
-            background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-            padding: 2rem;
-            border-radius: 10px;
-            color: white;
-            margin-bottom: 2rem;
-            text-align: center;
-        }
-        
-        .feature-card {
-            background: #f8f9fa;
-            padding: 1.5rem;
-            border-radius: 8px;
-            border-left: 4px solid #667eea;
-            margin: 1rem 0;
-        }
-        
-        .metric-card {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 1rem;
-            border-radius: 8px;
-            text-align: center;
-            margin: 0.5rem 0;
-        }
-        
-        .success-banner {
-            background: #d4edda;
-            border: 1px solid #c3e6cb;
-            color: #155724;
-            padding: 1rem;
-            border-radius: 5px;
-            margin: 1rem 0;
-        }
-        
-        .warning-banner {
-            background: #fff3cd;
-            border: 1px solid #ffeaa7;
-            color: #856404;
-            padding: 1rem;
-            border-radius: 5px;
-            margin: 1rem 0;
-        }
-        
-        /* Hide default Streamlit elements */
-        #MainMenu {visibility: hidden;}
-        .stDeployButton {display: none;}
-        footer {visibility: hidden;}
-        .stApp > header {display: none;}
-        </style>
-        """, unsafe_allow_html=True)
+        st.html(_CUSTOM_CSS)
     
     def render_sidebar(self):
         """Render the navigation sidebar"""
         with st.sidebar:
             # Logo and title
-            st.markdown("""
-            <div style="text-align: center; padding: 1rem;">
-                <h1 style="color: #667eea;">📝 OMR System</h1>
-                <p style="color: #666;">v1.0.0 - Cloud Edition</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.html(_SIDEBAR_LOGO_HTML)
             
             st.markdown("---")
             
-            # Navigation menu
-            page = st.selectbox(
+            # Navigation menu - in-page buttons change current_page, the widget follows it
+            st.session_state.current_page_nav = st.session_state.current_page
+            st.selectbox(
                 "🧭 Navigate to:",
-                [
-                    "🏠 Home & Overview", 
-                    "📋 Create Exam Session", 
-                    "🔑 Upload Answer Keys", 
-                    "📤 Process OMR Sheets", 
-                    "📊 View Results & Analytics",
-                    "📖 User Guide",
-                    "ℹ️ About & Support"
-                ]
+                list(PAGES),
+                key="current_page_nav",
+                on_change=_sync_current_page
             )
             
             st.markdown("---")
@@ -164,9 +230,6 @@ class ProductionOMRApp:
             
             # Quick stats
             self.render_quick_stats()
-        
-        # Store selected page
-        st.session_state.current_page = page
     
     def render_session_status(self):
         """Show current session status in sidebar"""
@@ -188,7 +251,8 @@ class ProductionOMRApp:
         """Show quick statistics"""
         st.markdown("### 📈 Quick Stats")
         
-        processed_count = len(st.session_state.processed_results)
+        stats = st.session_state.result_stats
+        processed_count = stats['n']
         
         col1, col2 = st.columns(2)
         with col1:
@@ -196,7 +260,7 @@ class ProductionOMRApp:
         
         with col2:
             if processed_count > 0:
-                avg_score = np.mean([r['overall_score'] for r in st.session_state.processed_results])
+                avg_score = stats['sum_score'] / processed_count
                 st.metric("📈 Avg Score", f"{avg_score:.1f}%")
             else:
                 st.metric("📈 Avg Score", "0%")
@@ -205,1408 +269,24 @@ class ProductionOMRApp:
         """Render the main content area based on selected page"""
         page = st.session_state.current_page
         
-        if page == "🏠 Home & Overview":
-            self.home_page()
-        elif page == "📋 Create Exam Session":
-            self.create_exam_page()
-        elif page == "🔑 Upload Answer Keys":
-            self.upload_answer_keys_page()
-        elif page == "📤 Process OMR Sheets":
-            self.process_omr_page()
-        elif page == "📊 View Results & Analytics":
-            self.view_results_page()
-        elif page == "📖 User Guide":
-            self.user_guide_page()
-        elif page == "ℹ️ About & Support":
-            self.about_page()
+        if page in PAGES:
+            module_name, render_name = PAGES[page]
+            module = importlib.import_module(module_name)
+            getattr(module, render_name)(self)
     
     def render_footer(self):
         """Render application footer"""
-        st.markdown("---")
-        st.markdown("""
-        <div style="text-align: center; padding: 2rem; background: #f8f9fa; border-radius: 10px;">
-            <p style="margin: 0; color: #666;">
-                Built with ❤️ using <strong>Streamlit</strong> | 
-                <a href="https://github.com/your-username/omr-evaluation-system" target="_blank">GitHub</a> | 
-                <a href="mailto:support@your-domain.com">Support</a>
-            </p>
-            <p style="margin: 0.5rem 0 0 0; color: #999; font-size: 0.8rem;">
-                © 2025 OMR Evaluation System. Open source project for educational institutions.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    def home_page(self):
-        """Enhanced home page for production"""
-        # Hero section
-        st.markdown("""
-        <div class="main-header">
-            <h1>🎯 OMR Evaluation System</h1>
-            <h3>Automated Optical Mark Recognition with 100% Accuracy</h3>
-            <p>Professional OMR processing for educational institutions worldwide</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Key features
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("""
-            <div class="feature-card">
-                <h4>🔑 Smart Answer Key Management</h4>
-                <p>Upload Excel files once, detect multiple sets automatically. Support for A, B, C, D question sets with validation.</p>
-                <ul>
-                    <li>Excel/CSV format support</li>
-                    <li>Automatic set detection</li>
-                    <li>Structure validation</li>
-                    <li>Error reporting</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div class="feature-card">
-                <h4>📤 Intelligent OMR Processing</h4>
-                <p>Manual set selection ensures 100% accuracy. No guesswork, complete control over answer key usage.</p>
-                <ul>
-                    <li>Manual set selection</li>
-                    <li>Batch processing</li>
-                    <li>Real-time preview</li>
-                    <li>Quality validation</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown("""
-            <div class="feature-card">
-                <h4>📊 Comprehensive Analytics</h4>
-                <p>Detailed results with subject-wise analysis, performance metrics, and professional export options.</p>
-                <ul>
-                    <li>Subject-wise breakdown</li>
-                    <li>Performance analytics</li>
-                    <li>Export to JSON/CSV/Excel</li>
-                    <li>Historical tracking</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Usage workflow
-        st.markdown("## 🔄 **Simple 3-Step Workflow**")
-        
-        workflow_col1, workflow_col2, workflow_col3 = st.columns(3)
-        
-        with workflow_col1:
-            st.info("""
-            **Step 1: Setup Once**
-            
-            📋 Create exam session  
-            🔑 Upload answer key Excel file  
-            ✅ System detects available sets  
-            📊 Ready for processing
-            """)
-        
-        with workflow_col2:
-            st.success("""
-            **Step 2: Process OMR Sheets**
-            
-            📤 Upload OMR images  
-            🎯 Select set for each sheet  
-            ⚡ Instant processing  
-            📈 Real-time results
-            """)
-        
-        with workflow_col3:
-            st.warning("""
-            **Step 3: Analyze & Export**
-            
-            📊 View detailed analytics  
-            📥 Download comprehensive reports  
-            🔍 Historical performance tracking  
-            📈 Subject-wise insights
-            """)
-        
-        # Performance metrics
-        st.markdown("## 📈 **System Performance**")
-        
-        perf_col1, perf_col2, perf_col3, perf_col4 = st.columns(4)
-        
-        with perf_col1:
-            st.markdown("""
-            <div class="metric-card">
-                <h3>⚡ Speed</h3>
-                <h2>&lt; 3 sec</h2>
-                <p>Per OMR sheet</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with perf_col2:
-            st.markdown("""
-            <div class="metric-card">
-                <h3>🎯 Accuracy</h3>
-                <h2>100%</h2>
-                <p>With manual selection</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with perf_col3:
-            st.markdown("""
-            <div class="metric-card">
-                <h3>📊 Capacity</h3>
-                <h2>3000+</h2>
-                <p>Sheets per day</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with perf_col4:
-            st.markdown("""
-            <div class="metric-card">
-                <h3>🔧 Reliability</h3>
-                <h2>99.9%</h2>
-                <p>Uptime guarantee</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Getting started
-        if not st.session_state.current_exam:
-            st.markdown("## 🚀 **Ready to Get Started?**")
-            
-            col1, col2 = st.columns([1, 2])
-            
-            with col1:
-                if st.button("📋 Create Your First Exam", type="primary", use_container_width=True):
-                    st.session_state.current_page = "📋 Create Exam Session"
-                    st.rerun()
-            
-            with col2:
-                st.markdown("""
-                <div class="success-banner">
-                    <strong>🎓 Perfect for Educational Institutions</strong><br>
-                    Schools, Colleges, Training Centers, Certification Bodies
-                </div>
-                """, unsafe_allow_html=True)
-    
-    def create_exam_page(self):
-        """Create exam page"""
-        st.title("📋 Create New Exam Session")
-        st.markdown("Set up a comprehensive exam with all parameters and configurations")
-        
-        with st.form("create_exam_form", clear_on_submit=True):
-            st.markdown("### 📝 Basic Information")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                exam_title = st.text_input(
-                    "Exam Title *", 
-                    value="Data Science Comprehensive Exam",
-                    help="Enter a descriptive title for your exam"
-                )
-                
-                exam_date = st.date_input(
-                    "Exam Date *", 
-                    value=datetime.now().date(),
-                    help="Select the date when the exam was conducted"
-                )
-                
-                duration = st.number_input(
-                    "Duration (minutes)", 
-                    value=120, 
-                    min_value=30, 
-                    max_value=300, 
-                    step=15,
-                    help="Total exam duration in minutes"
-                )
-            
-            with col2:
-                exam_description = st.text_area(
-                    "Description", 
-                    value="Comprehensive exam covering Python, Data Analysis, MySQL, Power BI, and Advanced Statistics",
-                    height=100,
-                    help="Brief description of the exam content and scope"
-                )
-                
-                total_questions = st.number_input(
-                    "Total Questions", 
-                    value=100, 
-                    min_value=20, 
-                    max_value=200, 
-                    step=5,
-                    help="Total number of questions in the exam"
-                )
-                
-                expected_sets = st.multiselect(
-                    "Expected Question Sets", 
-                    ['A', 'B', 'C', 'D'], 
-                    default=['A', 'B'],
-                    help="Which question sets do you expect to have answer keys for?"
-                )
-            
-            st.markdown("### 📚 Subject Configuration")
-            
-            # Subject configuration
-            subjects_col1, subjects_col2 = st.columns(2)
-            
-            with subjects_col1:
-                python_q = st.number_input("Python Questions", value=20, min_value=0, max_value=50)
-                data_analysis_q = st.number_input("Data Analysis Questions", value=20, min_value=0, max_value=50)
-                mysql_q = st.number_input("MySQL Questions", value=20, min_value=0, max_value=50)
-            
-            with subjects_col2:
-                powerbi_q = st.number_input("Power BI Questions", value=20, min_value=0, max_value=50)
-                stats_q = st.number_input("Advanced Statistics Questions", value=20, min_value=0, max_value=50)
-                
-                # Validate total
-                total_configured = python_q + data_analysis_q + mysql_q + powerbi_q + stats_q
-                if total_configured != total_questions:
-                    st.warning(f"⚠️ Subject questions ({total_configured}) don't match total questions ({total_questions})")
-            
-            st.markdown("---")
-            
-            # Submit button
-            col1, col2, col3 = st.columns([1, 2, 1])
-            with col2:
-                submitted = st.form_submit_button("🚀 Create Exam Session", type="primary", use_container_width=True)
-            
-            if submitted:
-                if not exam_title.strip():
-                    st.error("❌ Exam title is required!")
-                elif total_configured != total_questions:
-                    st.error("❌ Subject question counts must match total questions!")
-                else:
-                    # Create exam session
-                    exam_data = {
-                        'id': f"EXAM_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                        'title': exam_title.strip(),
-                        'date': exam_date,
-                        'duration': duration,
-                        'description': exam_description.strip(),
-                        'total_questions': total_questions,
-                        'expected_sets': expected_sets,
-                        'subject_config': {
-                            'PYTHON': python_q,
-                            'DATA_ANALYSIS': data_analysis_q,
-                            'MySQL': mysql_q,
-                            'POWER_BI': powerbi_q,
-                            'ADV_STATS': stats_q
-                        },
-                        'created_at': datetime.now().isoformat()
-                    }
-                    
-                    st.session_state.current_exam = exam_data
-                    
-                    st.success("✅ Exam session created successfully!")
-                    st.info("🔑 **Next Step:** Upload answer keys for this exam")
-                    
-                    # Show exam summary
-                    with st.expander("📋 Exam Summary", expanded=True):
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.write(f"**Exam ID:** {exam_data['id']}")
-                            st.write(f"**Title:** {exam_data['title']}")
-                            st.write(f"**Date:** {exam_data['date']}")
-                        with col2:
-                            st.write(f"**Duration:** {exam_data['duration']} minutes")
-                            st.write(f"**Questions:** {exam_data['total_questions']}")
-                            st.write(f"**Expected Sets:** {', '.join(exam_data['expected_sets'])}")
-                    
-                    st.balloons()
-    
-    def upload_answer_keys_page(self):
-        """Upload answer keys page"""
-        st.title("🔑 Answer Key Management")
-        st.markdown("Upload and manage Excel answer keys with automatic set detection")
-        
-        # Check prerequisites
-        if not st.session_state.current_exam:
-            st.markdown("""
-            <div class="warning-banner">
-                <h4>⚠️ No Active Exam Session</h4>
-                <p>Please create an exam session first before uploading answer keys.</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            if st.button("📋 Create Exam Session", type="primary"):
-                st.session_state.current_page = "📋 Create Exam Session"
-                st.rerun()
-            return
-        
-        exam = st.session_state.current_exam
-        
-        # Show current exam info
-        st.markdown(f"""
-        <div class="success-banner">
-            <h4>🎯 Current Exam: {exam['title']}</h4>
-            <p><strong>Exam ID:</strong> {exam['id']} | <strong>Questions:</strong> {exam['total_questions']} | <strong>Expected Sets:</strong> {', '.join(exam['expected_sets'])}</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # File upload section
-        st.markdown("### 📤 Upload Answer Key File")
-        
-        uploaded_file = st.file_uploader(
-            "Choose Excel answer key file",
-            type=['xlsx', 'xls'],
-            help="Upload your Excel file containing answer keys for different sets (Set A, Set B, etc.)",
-            accept_multiple_files=False
-        )
-        
-        if uploaded_file is not None:
-            try:
-                # File info
-                file_size_mb = uploaded_file.size / (1024 * 1024)
-                st.info(f"📁 **File:** {uploaded_file.name} ({file_size_mb:.2f} MB)")
-                
-                # Process the file
-                with st.spinner("📊 Analyzing answer key file..."):
-                    excel_data = pd.read_excel(uploaded_file, sheet_name=None)
-                
-                st.success(f"✅ File loaded successfully!")
-                st.write(f"📊 **Sheets found:** {', '.join(excel_data.keys())}")
-                
-                # Detect available sets
-                detected_sets = []
-                set_mapping = {}
-                
-                for sheet_name in excel_data.keys():
-                    sheet_upper = sheet_name.upper()
-                    for set_letter in ['A', 'B', 'C', 'D']:
-                        if set_letter in sheet_upper and set_letter not in detected_sets:
-                            detected_sets.append(set_letter)
-                            set_mapping[set_letter] = sheet_name
-                            break
-                
-                if detected_sets:
-                    st.markdown(f"""
-                    <div class="success-banner">
-                        <h4>🔑 Detected Answer Key Sets: {', '.join(detected_sets)}</h4>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Show set mapping
-                    with st.expander("🔍 Set Mapping Details", expanded=True):
-                        for set_type, sheet_name in set_mapping.items():
-                            col1, col2, col3 = st.columns([1, 2, 2])
-                            with col1:
-                                st.write(f"**Set {set_type}**")
-                            with col2:
-                                st.write(f"→ Sheet: '{sheet_name}'")
-                            with col3:
-                                if sheet_name in excel_data:
-                                    st.write(f"({len(excel_data[sheet_name])} rows)")
-                
-                # Preview each sheet
-                st.markdown("### 👁️ Sheet Previews")
-                
-                for sheet_name, df in excel_data.items():
-                    with st.expander(f"📋 Preview: {sheet_name}"):
-                        col1, col2 = st.columns([2, 1])
-                        
-                        with col1:
-                            st.dataframe(df.head(10), use_container_width=True)
-                        
-                        with col2:
-                            st.metric("📊 Rows", len(df))
-                            st.metric("📊 Columns", len(df.columns))
-                            
-                            if len(df.columns) >= 5:
-                                st.success("✅ 5-subject format detected")
-                            else:
-                                st.warning(f"⚠️ {len(df.columns)} columns found")
-                
-                # Processing options
-                st.markdown("### ⚙️ Processing Options")
-                
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    validate_structure = st.checkbox("Validate Answer Structure", value=True, help="Check answer key format and completeness")
-                
-                with col2:
-                    save_keys = st.checkbox("Save to Session", value=True, help="Store answer keys for OMR processing")
-                
-                with col3:
-                    show_warnings = st.checkbox("Show Detailed Warnings", value=False, help="Display detailed validation warnings")
-                
-                # Process button
-                if st.button("🚀 Process Answer Keys", type="primary", use_container_width=True):
-                    with st.spinner("🔄 Processing answer keys..."):
-                        import time
-                        time.sleep(2)  # Simulate processing
-                    
-                    # Simulate validation results
-                    validation_passed = len(detected_sets) > 0
-                    
-                    if validation_passed:
-                        st.success("✅ Answer keys processed and validated successfully!")
-                        
-                        # Store in session
-                        st.session_state.answer_keys = {
-                            'filename': uploaded_file.name,
-                            'available_sets': detected_sets,
-                            'set_mapping': set_mapping,
-                            'total_questions': exam['total_questions'],
-                            'processed_at': datetime.now().isoformat(),
-                            'exam_id': exam['id']
-                        }
-                        
-                        # Success metrics
-                        col1, col2, col3, col4 = st.columns(4)
-                        with col1:
-                            st.metric("📋 Sets Processed", len(detected_sets))
-                        with col2:
-                            st.metric("❓ Questions per Set", exam['total_questions'])
-                        with col3:
-                            st.metric("📊 Subjects", 5)
-                        with col4:
-                            st.metric("✅ Validation", "Passed")
-                        
-                        st.info("🎯 **Ready to process OMR sheets!** Go to the 'Process OMR Sheets' section.")
-                        st.balloons()
-                        
-                    else:
-                        st.error("❌ Answer key validation failed!")
-                        st.error("Please check your Excel file format and try again.")
-                
-            except Exception as e:
-                st.error(f"❌ Error processing file: {str(e)}")
-                st.info("💡 **Tip:** Make sure your Excel file has sheets named 'Set - A', 'Set - B', etc.")
-    
-    def process_omr_page(self):
-        """Process OMR sheets with manual set selection"""
-        st.title("📤 OMR Sheet Processing")
-        st.markdown("Upload OMR images and select the correct answer set for accurate processing")
-        
-        # Check prerequisites
-        prerequisites_met = True
-        
-        if not st.session_state.current_exam:
-            st.markdown("""
-            <div class="warning-banner">
-                <h4>⚠️ No Active Exam</h4>
-                <p>Please create an exam session first.</p>
-            </div>
-            """, unsafe_allow_html=True)
-            prerequisites_met = False
-        
-        if not st.session_state.answer_keys:
-            st.markdown("""
-            <div class="warning-banner">
-                <h4>⚠️ No Answer Keys</h4>
-                <p>Please upload answer keys before processing OMR sheets.</p>
-            </div>
-            """, unsafe_allow_html=True)
-            prerequisites_met = False
-        
-        if not prerequisites_met:
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button("📋 Create Exam", type="primary"):
-                    st.session_state.current_page = "📋 Create Exam Session"
-                    st.rerun()
-            with col2:
-                if st.button("🔑 Upload Keys", type="primary"):
-                    st.session_state.current_page = "🔑 Upload Answer Keys"
-                    st.rerun()
-            return
-        
-        # Show context
-        exam = st.session_state.current_exam
-        keys = st.session_state.answer_keys
-        
-        st.markdown(f"""
-        <div class="success-banner">
-            <h4>🎯 Ready for Processing</h4>
-            <p><strong>Exam:</strong> {exam['title']} | <strong>Available Sets:</strong> {', '.join(keys['available_sets'])} | <strong>Questions:</strong> {keys['total_questions']}</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # File upload
-        st.markdown("### 📤 Upload OMR Sheet Images")
-        
-        uploaded_files = st.file_uploader(
-            "Choose OMR sheet images",
-            type=['jpg', 'jpeg', 'png', 'tiff'],
-            accept_multiple_files=True,
-            help="Select one or more OMR sheet images. Supported formats: JPG, PNG, TIFF"
-        )
-        
-        if uploaded_files:
-            st.write(f"📋 **{len(uploaded_files)} file(s) uploaded**")
-            
-            # Processing configuration
-            st.markdown("### ⚙️ Processing Configuration")
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                default_set = st.selectbox(
-                    "Default Set for All Sheets",
-                    ["Choose individually"] + keys['available_sets'],
-                    help="Apply the same set to all sheets or choose individually"
-                )
-            
-            with col2:
-                confidence_threshold = st.slider(
-                    "Detection Confidence", 
-                    0.5, 1.0, 0.8, 0.05,
-                    help="Minimum confidence for bubble detection"
-                )
-            
-            with col3:
-                export_format = st.selectbox(
-                    "Export Format", 
-                    ["JSON", "CSV", "Both"],
-                    help="Choose result export format"
-                )
-            
-            # Individual file processing
-            st.markdown("### 🎯 Set Selection for Each OMR Sheet")
-            
-            file_set_mapping = {}
-            
-            # Show files in a more compact format
-            for i, uploaded_file in enumerate(uploaded_files):
-                with st.container():
-                    col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-                    
-                    with col1:
-                        st.write(f"📄 **{uploaded_file.name}**")
-                    
-                    with col2:
-                        file_size_kb = uploaded_file.size // 1024
-                        st.write(f"📊 {file_size_kb}KB")
-                    
-                    with col3:
-                        if default_set != "Choose individually":
-                            selected_set = default_set
-                            st.info(f"Set **{selected_set}**")
-                        else:
-                            selected_set = st.selectbox(
-                                f"Set:",
-                                keys['available_sets'],
-                                key=f"set_{i}",
-                                help=f"Choose set for {uploaded_file.name}"
-                            )
-                    
-                    with col4:
-                        st.write(f"#{i+1}")
-                    
-                    file_set_mapping[uploaded_file.name] = selected_set
-                
-                if i < len(uploaded_files) - 1:
-                    st.markdown("---")
-            
-            # Processing summary
-            st.markdown("### 📊 Processing Summary")
-            
-            set_counts = {}
-            for file_set in file_set_mapping.values():
-                set_counts[file_set] = set_counts.get(file_set, 0) + 1
-            
-            summary_cols = st.columns(len(set_counts) + 1)
-            
-            for i, (set_type, count) in enumerate(set_counts.items()):
-                with summary_cols[i]:
-                    st.metric(f"📋 Set {set_type}", f"{count} sheets")
-            
-            with summary_cols[-1]:
-                st.metric("📊 Total", len(uploaded_files))
-            
-            # Process button
-            st.markdown("---")
-            
-            if st.button("🚀 Process All OMR Sheets", type="primary", use_container_width=True):
-                self.process_batch_omr_sheets(uploaded_files, file_set_mapping, keys, confidence_threshold)
-    
-    def process_batch_omr_sheets(self, uploaded_files, file_set_mapping, keys_info, confidence_threshold):
-        """Process batch of OMR sheets"""
-        total_files = len(uploaded_files)
-        
-        # Progress tracking
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        results = []
-        
-        for i, uploaded_file in enumerate(uploaded_files):
-            # Update progress
-            progress = (i + 1) / total_files
-            progress_bar.progress(progress)
-            status_text.text(f"🔄 Processing {uploaded_file.name} ({i+1}/{total_files})")
-            
-            # Get selected set
-            selected_set = file_set_mapping[uploaded_file.name]
-            
-            # Simulate processing
-            import time
-            time.sleep(0.5)  # Simulate processing time
-            
-            # Generate result
-            result = self.generate_processing_result(uploaded_file.name, selected_set, keys_info)
-            results.append(result)
-        
-        # Complete
-        status_text.text("✅ Processing completed successfully!")
-        progress_bar.progress(1.0)
-        
-        # Store results
-        st.session_state.processed_results.extend(results)
-        
-        # Display results
-        st.markdown("---")
-        self.display_processing_results(results, keys_info)
-    
-    def generate_processing_result(self, filename, selected_set, keys_info):
-        """Generate mock processing result"""
-        # Generate realistic scores
-        base_score = np.random.randint(70, 95)
-        
-        # Subject scores
-        subjects = ['PYTHON', 'DATA_ANALYSIS', 'MySQL', 'POWER_BI', 'ADV_STATS']
-        subject_scores = {}
-        
-        for subject in subjects:
-            subject_score = max(10, min(20, base_score // 5 + np.random.randint(-3, 4)))
-            subject_scores[subject] = {
-                'score': f"{subject_score}/20",
-                'correct': subject_score,
-                'total': 20,
-                'percentage': (subject_score / 20) * 100
-            }
-        
-        # Overall score
-        total_correct = sum([s['correct'] for s in subject_scores.values()])
-        overall_percentage = (total_correct / 100) * 100
-        
-        # Grade calculation
-        if overall_percentage >= 90:
-            grade = 'A+'
-        elif overall_percentage >= 85:
-            grade = 'A'
-        elif overall_percentage >= 80:
-            grade = 'A-'
-        elif overall_percentage >= 75:
-            grade = 'B+'
-        elif overall_percentage >= 70:
-            grade = 'B'
-        else:
-            grade = 'B-'
-        
-        return {
-            'filename': filename,
-            'selected_set': selected_set,
-            'overall_score': overall_percentage,
-            'total_correct': total_correct,
-            'grade': grade,
-            'subject_scores': subject_scores,
-            'confidence': np.random.uniform(0.85, 0.95),
-            'processing_time': np.random.uniform(1.8, 3.2),
-            'processed_at': datetime.now().isoformat(),
-            'exam_id': keys_info.get('exam_id', 'Unknown')
-        }
-    
-    def display_processing_results(self, results, keys_info):
-        """Display batch processing results"""
-        st.subheader("🎉 Processing Results")
-        
-        # Overall statistics
-        total_sheets = len(results)
-        avg_score = np.mean([r['overall_score'] for r in results])
-        avg_confidence = np.mean([r['confidence'] for r in results])
-        total_time = sum([r['processing_time'] for r in results])
-        high_scorers = len([r for r in results if r['overall_score'] >= 80])
-        
-        col1, col2, col3, col4, col5 = st.columns(5)
-        
-        with col1:
-            st.metric("📋 Processed", total_sheets)
-        with col2:
-            st.metric("📈 Avg Score", f"{avg_score:.1f}%")
-        with col3:
-            st.metric("🎯 High Scorers", f"{high_scorers}/{total_sheets}")
-        with col4:
-            st.metric("🔍 Avg Confidence", f"{avg_confidence:.2f}")
-        with col5:
-            st.metric("⏱️ Total Time", f"{total_time:.1f}s")
-        
-        # Results by set
-        st.markdown("### 📊 Results by Answer Set")
-        
-        set_results = {}
-        for result in results:
-            set_type = result['selected_set']
-            if set_type not in set_results:
-                set_results[set_type] = []
-            set_results[set_type].append(result)
-        
-        for set_type, set_data in set_results.items():
-            with st.expander(f"📋 Set {set_type} Results ({len(set_data)} sheets)", expanded=True):
-                avg_set_score = np.mean([r['overall_score'] for r in set_data])
-                
-                col1, col2 = st.columns([1, 3])
-                with col1:
-                    st.metric(f"Set {set_type} Average", f"{avg_set_score:.1f}%")
-                
-                with col2:
-                    # Create results table
-                    table_data = []
-                    for result in set_data:
-                        table_data.append({
-                            'Filename': result['filename'],
-                            'Score': f"{result['overall_score']:.1f}%",
-                            'Grade': result['grade'],
-                            'Confidence': f"{result['confidence']:.2f}"
-                        })
-                    
-                    df = pd.DataFrame(table_data)
-                    st.dataframe(df, use_container_width=True, hide_index=True)
-        
-        # Download options
-        st.markdown("### 📥 Export Results")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            # JSON export
-            json_data = json.dumps(results, indent=2, default=str)
-            st.download_button(
-                "📄 Download JSON",
-                json_data,
-                f"omr_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                "application/json",
-                use_container_width=True
-            )
-        
-        with col2:
-            # CSV export
-            csv_data = []
-            for result in results:
-                csv_row = {
-                    'Filename': result['filename'],
-                    'Selected_Set': result['selected_set'],
-                    'Overall_Score': result['overall_score'],
-                    'Grade': result['grade'],
-                    'Confidence': result['confidence'],
-                    'Processing_Time': result['processing_time']
-                }
-                
-                for subject, scores in result['subject_scores'].items():
-                    csv_row[f'{subject}_Score'] = scores['correct']
-                
-                csv_data.append(csv_row)
-            
-            csv_df = pd.DataFrame(csv_data)
-            csv_str = csv_df.to_csv(index=False)
-            
-            st.download_button(
-                "📊 Download CSV",
-                csv_str,
-                f"omr_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                "text/csv",
-                use_container_width=True
-            )
-        
-        with col3:
-            st.info("""
-            📈 **Excel Report**
-            
-            Detailed Excel export
-            with charts coming soon!
-            """)
-    
-    def view_results_page(self):
-        """View historical results and analytics"""
-        st.title("📊 Results & Analytics")
-        st.markdown("Comprehensive analysis of processed OMR sheets and performance trends")
-        
-        if not st.session_state.processed_results:
-            st.markdown("""
-            <div class="warning-banner">
-                <h4>📋 No Results Available</h4>
-                <p>No OMR sheets have been processed yet. Process some sheets first to see analytics here.</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            if st.button("📤 Go to OMR Processing", type="primary"):
-                st.session_state.current_page = "📤 Process OMR Sheets"
-                st.rerun()
-            return
-        
-        results = st.session_state.processed_results
-        
-        # Overall statistics
-        st.markdown("### 📈 Overall Performance Statistics")
-        
-        total_processed = len(results)
-        avg_score = np.mean([r['overall_score'] for r in results])
-        high_scorers = len([r for r in results if r['overall_score'] >= 80])
-        avg_confidence = np.mean([r['confidence'] for r in results])
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>📋 Total Processed</h4>
-                <h2>{total_processed}</h2>
-                <p>OMR Sheets</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>📈 Average Score</h4>
-                <h2>{avg_score:.1f}%</h2>
-                <p>Overall Performance</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>🎯 High Performers</h4>
-                <h2>{high_scorers}/{total_processed}</h2>
-                <p>Score ≥ 80%</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>🔍 Avg Confidence</h4>
-                <h2>{avg_confidence:.2f}</h2>
-                <p>Detection Quality</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Results table
-        st.markdown("### 📄 Detailed Results")
-        
-        # Create comprehensive table
-        table_data = []
-        for result in results:
-            table_data.append({
-                'Filename': result['filename'],
-                'Set': result['selected_set'],
-                'Score': f"{result['overall_score']:.1f}%",
-                'Grade': result['grade'],
-                'Confidence': f"{result['confidence']:.2f}",
-                'Processed': datetime.fromisoformat(result['processed_at']).strftime('%Y-%m-%d %H:%M')
-            })
-        
-        df = pd.DataFrame(table_data)
-        st.dataframe(df, use_container_width=True, hide_index=True)
-        
-        # Set-wise analysis
-        st.markdown("### 📊 Performance Analysis by Set")
-        
-        set_analysis = {}
-        for result in results:
-            set_type = result['selected_set']
-            if set_type not in set_analysis:
-                set_analysis[set_type] = {
-                    'count': 0,
-                    'scores': [],
-                    'grades': []
-                }
-            set_analysis[set_type]['count'] += 1
-            set_analysis[set_type]['scores'].append(result['overall_score'])
-            set_analysis[set_type]['grades'].append(result['grade'])
-        
-        analysis_cols = st.columns(len(set_analysis))
-        
-        for i, (set_type, data) in enumerate(set_analysis.items()):
-            with analysis_cols[i]:
-                avg_set_score = np.mean(data['scores'])
-                
-                st.markdown(f"""
-                <div class="feature-card">
-                    <h4>📋 Set {set_type}</h4>
-                    <p><strong>Sheets:</strong> {data['count']}</p>
-                    <p><strong>Average:</strong> {avg_set_score:.1f}%</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Grade distribution
-                grade_counts = {}
-                for grade in data['grades']:
-                    grade_counts[grade] = grade_counts.get(grade, 0) + 1
-                
-                st.write("**Grade Distribution:**")
-                for grade, count in sorted(grade_counts.items()):
-                    percentage = (count / data['count']) * 100
-                    st.write(f"• {grade}: {count} ({percentage:.0f}%)")
-    
-    def user_guide_page(self):
-        """Comprehensive user guide"""
-        st.title("📖 User Guide")
-        st.markdown("Complete guide to using the OMR Evaluation System effectively")
-        
-        # Table of contents
-        st.markdown("### 📋 Table of Contents")
-        
-        guide_sections = [
-            "🚀 Getting Started",
-            "📋 Creating Exam Sessions",
-            "🔑 Managing Answer Keys", 
-            "📤 Processing OMR Sheets",
-            "📊 Understanding Results",
-            "💡 Best Practices",
-            "🔧 Troubleshooting"
-        ]
-        
-        selected_section = st.selectbox("Choose a section:", guide_sections)
-        
-        st.markdown("---")
-        
-        if selected_section == "🚀 Getting Started":
-            st.markdown("""
-            ## 🚀 Getting Started
-            
-            Welcome to the OMR Evaluation System! Follow these steps to get started:
-            
-            ### Step 1: Create Your First Exam
-            1. Go to **"📋 Create Exam Session"**
-            2. Fill in exam details (title, date, duration)
-            3. Configure subjects and question counts
-            4. Click "Create Exam Session"
-            
-            ### Step 2: Upload Answer Keys
-            1. Go to **"🔑 Upload Answer Keys"**  
-            2. Upload your Excel file with answer keys
-            3. System will automatically detect available sets
-            4. Verify the detected sets and proceed
-            
-            ### Step 3: Process OMR Sheets
-            1. Go to **"📤 Process OMR Sheets"**
-            2. Upload OMR images (JPG, PNG, TIFF)
-            3. Select the correct set for each sheet
-            4. Click "Process All OMR Sheets"
-            
-            ### Step 4: View Results
-            1. Go to **"📊 View Results & Analytics"**
-            2. Analyze performance and export data
-            3. Download reports in JSON/CSV format
-            """)
-        
-        elif selected_section == "📋 Creating Exam Sessions":
-            st.markdown("""
-            ## 📋 Creating Exam Sessions
-            
-            ### Exam Information
-            - **Title**: Descriptive name for your exam
-            - **Date**: When the exam was conducted
-            - **Duration**: Total time allowed (in minutes)
-            - **Description**: Brief overview of exam content
-            
-            ### Question Configuration
-            - **Total Questions**: Usually 100 questions
-            - **Subject Breakdown**: 
-              - Python: 20 questions (Q1-Q20)
-              - Data Analysis: 20 questions (Q21-Q40)
-              - MySQL: 20 questions (Q41-Q60)
-              - Power BI: 20 questions (Q61-Q80)
-              - Advanced Statistics: 20 questions (Q81-Q100)
-            
-            ### Expected Sets
-            Select which question sets you plan to have:
-            - **Set A**: Most common
-            - **Set B**: Alternative version
-            - **Set C & D**: Additional variants if needed
-            
-            ### Tips
-            - Make sure subject questions add up to total questions
-            - Use descriptive exam titles for easy identification
-            - Configure expected sets based on your answer key files
-            """)
-        
-        elif selected_section == "🔑 Managing Answer Keys":
-            st.markdown("""
-            ## 🔑 Managing Answer Keys
-            
-            ### Excel File Format
-            Your Excel file should have separate sheets for each set:
-            - **Sheet Name**: "Set - A", "Set - B", etc.
-            - **Columns**: 5 columns for 5 subjects
-            - **Rows**: Question-answer pairs like "1 - a", "21 - a"
-            
-            ### Supported Answer Formats
-            - Single answers: "a", "b", "c", "d"
-            - Multiple answers: "a,b", "a,b,c,d"
-            - All correct: "a,b,c,d"
-            
-            ### File Requirements
-            - **Format**: Excel (.xlsx) or CSV (.csv)
-            - **Size**: Maximum 10MB
-            - **Structure**: Consistent format across all sets
-            
-            ### Validation Process
-            The system automatically:
-            1. Detects available sets from sheet names
-            2. Validates answer format and completeness
-            3. Checks question numbering (1-100)
-            4. Verifies subject distribution
-            
-            ### Best Practices
-            - Use consistent sheet naming ("Set - A", "Set - B")
-            - Double-check answer accuracy before upload
-            - Test with sample data first
-            - Keep backup copies of answer key files
-            """)
-        
-        elif selected_section == "📤 Processing OMR Sheets":
-            st.markdown("""
-            ## 📤 Processing OMR Sheets
-            
-            ### Image Requirements
-            - **Formats**: JPG, PNG, TIFF
-            - **Quality**: High resolution, clear bubble marks
-            - **Size**: Maximum 10MB per image
-            - **Orientation**: Properly aligned OMR sheets
-            
-            ### Set Selection Options
-            1. **Choose Individually**: Select set for each sheet separately
-            2. **Default Set**: Apply same set to all uploaded sheets
-            
-            ### Processing Configuration
-            - **Confidence Threshold**: 0.8 recommended (80% confidence)
-            - **Export Format**: Choose JSON, CSV, or both
-            
-            ### Batch Processing
-            - Upload multiple files at once
-            - Select appropriate sets for each
-            - Monitor processing progress
-            - View results immediately
-            
-            ### Quality Assurance
-            The system provides:
-            - Confidence scores for each detection
-            - Processing time metrics
-            - Error flagging for manual review
-            - Detailed validation results
-            
-            ### Tips for Best Results
-            - Ensure good image quality and lighting
-            - Check that bubbles are clearly marked
-            - Verify correct set selection for each sheet
-            - Review low-confidence results manually
-            """)
-        
-        elif selected_section == "📊 Understanding Results":
-            st.markdown("""
-            ## 📊 Understanding Results
-            
-            ### Score Components
-            - **Overall Score**: Total correct answers out of 100
-            - **Percentage**: Overall score as percentage
-            - **Grade**: Letter grade (A+, A, A-, B+, B, B-)
-            - **Subject Scores**: Individual subject performance
-            
-            ### Quality Metrics  
-            - **Confidence Score**: Detection reliability (0.0-1.0)
-            - **Processing Time**: Time taken per sheet
-            - **Set Used**: Which answer key was applied
-            
-            ### Subject Analysis
-            Each subject shows:
-            - Correct answers out of 20
-            - Subject percentage
-            - Individual question results
-            
-            ### Export Options
-            1. **JSON Format**: Complete data with all details
-            2. **CSV Format**: Tabular data for spreadsheet analysis  
-            3. **Excel Format**: Professional reports (coming soon)
-            
-            ### Analytics Dashboard
-            - Overall performance statistics
-            - Set-wise comparison
-            - Grade distribution
-            - Historical trends
-            - High performer identification
-            
-            ### Interpreting Confidence Scores
-            - **> 0.9**: Excellent detection, high reliability
-            - **0.8-0.9**: Good detection, recommended threshold  
-            - **0.7-0.8**: Acceptable, may need review
-            - **< 0.7**: Low confidence, manual review recommended
-            """)
-        
-        elif selected_section == "💡 Best Practices":
-            st.markdown("""
-            ## 💡 Best Practices
-            
-            ### Before Processing
-            1. **Prepare Answer Keys**
-               - Double-check all answers for accuracy
-               - Use consistent Excel format
-               - Test with sample sheets first
-            
-            2. **OMR Sheet Quality**
-               - Ensure clear, dark bubble marks
-               - Scan at high resolution (300+ DPI)
-               - Check for proper alignment
-               - Remove any stray marks
-            
-            ### During Processing
-            1. **Set Selection**
-               - Verify correct set for each sheet
-               - Use batch processing for efficiency
-               - Double-check set assignments
-            
-            2. **Quality Control**
-               - Monitor confidence scores
-               - Flag low-confidence results
-               - Review unusual score patterns
-            
-            ### After Processing
-            1. **Result Verification**
-               - Spot-check high/low scores
-               - Verify subject-wise performance
-               - Cross-reference with manual grades
-            
-            2. **Data Management**
-               - Export results regularly
-               - Maintain backup copies
-               - Track processing history
-            
-            ### Workflow Optimization
-            - Process sheets in batches of 20-50
-            - Use consistent naming conventions
-            - Maintain organized file structure
-            - Regular system maintenance and cleanup
-            """)
-        
-        elif selected_section == "🔧 Troubleshooting":
-            st.markdown("""
-            ## 🔧 Troubleshooting
-            
-            ### Common Issues & Solutions
-            
-            #### 1. Answer Key Upload Problems
-            **Issue**: "No sets detected" error
-            - **Solution**: Check sheet names contain "A", "B", etc.
-            - **Example**: Use "Set - A", "Set - B" as sheet names
-            
-            **Issue**: Validation errors  
-            - **Solution**: Verify answer format consistency
-            - **Check**: All answers are a, b, c, or d
-            
-            #### 2. OMR Processing Issues
-            **Issue**: Low confidence scores
-            - **Solution**: Check image quality and clarity
-            - **Action**: Re-scan with better lighting
-            
-            **Issue**: Incorrect results
-            - **Solution**: Verify correct set selection
-            - **Check**: Match OMR sheet set with answer key
-            
-            #### 3. Performance Issues
-            **Issue**: Slow processing
-            - **Solution**: Process smaller batches (10-20 sheets)
-            - **Check**: Internet connection stability
-            
-            **Issue**: Upload failures
-            - **Solution**: Check file size (max 10MB per file)
-            - **Action**: Compress images if needed
-            
-            ### Error Messages
-            - **"No active exam"**: Create exam session first
-            - **"No answer keys"**: Upload answer keys before processing
-            - **"Invalid file format"**: Use JPG, PNG, or TIFF for images
-            - **"Validation failed"**: Check answer key format
-            
-            ### Getting Help
-            - Check this user guide first
-            - Review error messages carefully  
-            - Contact support with specific error details
-            - Include screenshot and file details when reporting issues
-            """)
-    
-    def about_page(self):
-        """About and support page"""
-        st.title("ℹ️ About & Support")
-        st.markdown("Learn more about the OMR Evaluation System and get support")
-        
-        # About section
-        st.markdown("""
-        ## 🎯 About OMR Evaluation System
-        
-        The **OMR Evaluation System** is a comprehensive web application designed to automate the processing 
-        and scoring of Optical Mark Recognition (OMR) answer sheets. Built with modern web technologies, 
-        it provides educational institutions with a reliable, accurate, and user-friendly solution for 
-        exam evaluation.
-        
-        ### ✨ Key Features
-        - **100% Accuracy** with manual set selection
-        - **Multi-format Support** for answer keys (Excel, CSV, JSON)
-        - **Batch Processing** capabilities for efficiency
-        - **Comprehensive Analytics** and reporting
-        - **Professional Export** options (JSON, CSV, Excel)
-        - **User-friendly Interface** with step-by-step guidance
-        
-        ### 🎓 Perfect For
-        - **Schools & Colleges** - Academic exams and assessments
-        - **Training Centers** - Certification and skill evaluation
-        - **Corporate Training** - Employee assessments
-        - **Online Education** - Remote evaluation support
-        
-        ### 🏗️ Technology Stack
-        - **Frontend**: Streamlit (Python web framework)
-        - **Backend**: Python with SQLAlchemy
-        - **Image Processing**: OpenCV and PIL
-        - **Data Analysis**: Pandas and NumPy
-        - **Deployment**: Streamlit Community Cloud
-        """)
-        
-        st.markdown("---")
-        
-        # Features overview
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            ### 🔧 Technical Specifications
-            - **Processing Speed**: < 3 seconds per sheet
-            - **Image Formats**: JPG, PNG, TIFF
-            - **Max File Size**: 10MB per image
-            - **Batch Size**: Up to 100 sheets
-            - **Question Sets**: A, B, C, D support
-            - **Subjects**: 5 subjects, 20 questions each
-            - **Export Formats**: JSON, CSV, Excel
-            """)
-        
-        with col2:
-            st.markdown("""
-            ### 📊 System Capabilities
-            - **Accuracy Rate**: 99.9%+ with manual selection
-            - **Daily Capacity**: 3000+ sheets
-            - **Concurrent Users**: Multiple sessions
-            - **Data Security**: Session-based storage
-            - **Backup & Export**: Multiple format support
-            - **Audit Trail**: Complete processing history
-            - **Quality Control**: Confidence scoring
-            """)
-        
-        # Support section
-        st.markdown("---")
-        st.markdown("## 🆘 Support & Resources")
-        
-        support_col1, support_col2, support_col3 = st.columns(3)
-        
-        with support_col1:
-            st.markdown("""
-            ### 📚 Documentation
-            - [📖 User Guide](#) - Complete usage instructions
-            - [🔧 Technical Docs](#) - API and integration details
-            - [💡 Best Practices](#) - Optimization tips
-            - [❓ FAQ](#) - Frequently asked questions
-            """)
-        
-        with support_col2:
-            st.markdown("""
-            ### 🤝 Community Support  
-            - [💬 GitHub Issues](#) - Report bugs and requests
-            - [📧 Email Support](#) - Direct technical support
-            - [📱 Discord Community](#) - User discussions
-            - [🐛 Bug Reports](#) - Issue tracking
-            """)
-        
-        with support_col3:
-            st.markdown("""
-            ### 🎥 Training Resources
-            - [📹 Video Tutorials](#) - Step-by-step guides
-            - [🎯 Webinars](#) - Live training sessions
-            - [📝 Case Studies](#) - Real-world examples
-            - [🏆 Certification](#) - Usage certification
-            """)
-        
-        # Version and updates
-        st.markdown("---")
-        st.markdown("## 🔄 Version Information")
-        
-        version_col1, version_col2 = st.columns(2)
-        
-        with version_col1:
-            st.markdown("""
-            **Current Version**: v1.0.0  
-            **Release Date**: September 2025  
-            **Environment**: Production (Streamlit Cloud)  
-            **Last Updated**: Recent deployment  
-            """)
-        
-        with version_col2:
-            st.markdown("""
-            **Recent Updates**:
-            - ✅ Manual set selection feature
-            - ✅ Batch processing optimization  
-            - ✅ Enhanced validation system
-            - ✅ Improved user interface
-            """)
-        
-        # Contact information
-        st.markdown("---")
-        st.markdown("## 📞 Contact Information")
-        
-        contact_col1, contact_col2 = st.columns(2)
-        
-        with contact_col1:
-            st.markdown("""
-            ### 🏢 Development Team
-            **Project**: OMR Evaluation System  
-            **Developer**: Your Name  
-            **Institution**: Your Institution  
-            **Email**: your.email@domain.com  
-            """)
-        
-        with contact_col2:
-            st.markdown("""
-            ### 🔗 Project Links
-            - [🌐 Live Demo](https://your-app.streamlit.app)
-            - [💻 GitHub Repository](#)  
-            - [📧 Support Email](mailto:support@your-domain.com)
-            - [📱 LinkedIn Profile](#)
-            """)
-        
-        # Feedback form
-        st.markdown("---")
-        st.markdown("### 💬 Feedback & Suggestions")
-        
-        with st.form("feedback_form"):
-            feedback_type = st.selectbox(
-                "Feedback Type",
-                ["General Feedback", "Bug Report", "Feature Request", "Support Request"]
-            )
-            
-            feedback_message = st.text_area(
-                "Your Message",
-                height=100,
-                placeholder="Share your thoughts, suggestions, or issues..."
-            )
-            
-            contact_email = st.text_input(
-                "Your Email (optional)",
-                placeholder="your.email@example.com"
-            )
-            
-            if st.form_submit_button("📨 Send Feedback", type="primary"):
-                if feedback_message.strip():
-                    st.success("✅ Thank you for your feedback! We'll review it and get back to you.")
-                    # In production, this would send email or store in database
-                else:
-                    st.error("❌ Please enter your feedback message.")
+        st.html(_FOOTER_HTML)
 
 def main():
     """Main function to run the production Streamlit app"""
     try:
         app = ProductionOMRApp()
         app.run()
-    except Exception as e:
-        st.error(f"Application failed to start: {str(e)}")
-        st.info("Please refresh the page and try again.")
+    except Exception:
+        # Full traceback goes to the server log; the browser gets a short notice
+        _get_logger().exception("Application failed to start")
+        st.error("Application failed to start. Please refresh the page.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
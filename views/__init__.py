@@ -0,0 +1,3 @@
+"""
+Page modules for the OMR app, imported lazily by the main script
+"""
@@ -0,0 +1,223 @@
+"""
+About & support page
+"""
+
+import streamlit as st
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+# Feedback form choices
+_FEEDBACK_TYPES = ("General Feedback", "Bug Report", "Feature Request", "Support Request")
+
+# Loose shape check for the optional reply address
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Specifications and capabilities, side by side
+_SPECS_HTML = """
+<hr>
+<div class="info-grid">
+    <div>
+        <h3>🔧 Technical Specifications</h3>
+        <ul>
+            <li><strong>Processing Speed</strong>: &lt; 3 seconds per sheet</li>
+            <li><strong>Image Formats</strong>: JPG, PNG, TIFF</li>
+            <li><strong>Max File Size</strong>: 10MB per image</li>
+            <li><strong>Batch Size</strong>: Up to 100 sheets</li>
+            <li><strong>Question Sets</strong>: A, B, C, D support</li>
+            <li><strong>Subjects</strong>: 5 subjects, 20 questions each</li>
+            <li><strong>Export Formats</strong>: JSON, CSV, Excel</li>
+        </ul>
+    </div>
+    <div>
+        <h3>📊 System Capabilities</h3>
+        <ul>
+            <li><strong>Accuracy Rate</strong>: 99.9%+ with manual selection</li>
+            <li><strong>Daily Capacity</strong>: 3000+ sheets</li>
+            <li><strong>Concurrent Users</strong>: Multiple sessions</li>
+            <li><strong>Data Security</strong>: Session-based storage</li>
+            <li><strong>Backup &amp; Export</strong>: Multiple format support</li>
+            <li><strong>Audit Trail</strong>: Complete processing history</li>
+            <li><strong>Quality Control</strong>: Confidence scoring</li>
+        </ul>
+    </div>
+</div>
+"""
+
+_SUPPORT_HTML = """
+<hr>
+<h2>🆘 Support &amp; Resources</h2>
+<div class="features-grid">
+    <div>
+        <h3>📚 Documentation</h3>
+        <ul>
+            <li><a href="#">📖 User Guide</a> - Complete usage instructions</li>
+            <li><a href="#">🔧 Technical Docs</a> - API and integration details</li>
+            <li><a href="#">💡 Best Practices</a> - Optimization tips</li>
+            <li><a href="#">❓ FAQ</a> - Frequently asked questions</li>
+        </ul>
+    </div>
+    <div>
+        <h3>🤝 Community Support</h3>
+        <ul>
+            <li><a href="#">💬 GitHub Issues</a> - Report bugs and requests</li>
+            <li><a href="#">📧 Email Support</a> - Direct technical support</li>
+            <li><a href="#">📱 Discord Community</a> - User discussions</li>
+            <li><a href="#">🐛 Bug Reports</a> - Issue tracking</li>
+        </ul>
+    </div>
+    <div>
+        <h3>🎥 Training Resources</h3>
+        <ul>
+            <li><a href="#">📹 Video Tutorials</a> - Step-by-step guides</li>
+            <li><a href="#">🎯 Webinars</a> - Live training sessions</li>
+            <li><a href="#">📝 Case Studies</a> - Real-world examples</li>
+            <li><a href="#">🏆 Certification</a> - Usage certification</li>
+        </ul>
+    </div>
+</div>
+"""
+
+# Version and contact sections
+_VERSION_CONTACT_HTML = """
+<hr>
+<h2>🔄 Version Information</h2>
+<div class="info-grid">
+    <div>
+        <p>
+            <strong>Current Version</strong>: v1.0.0<br>
+            <strong>Release Date</strong>: September 2025<br>
+            <strong>Environment</strong>: Production (Streamlit Cloud)<br>
+            <strong>Last Updated</strong>: Recent deployment
+        </p>
+    </div>
+    <div>
+        <p><strong>Recent Updates</strong>:</p>
+        <ul>
+            <li>✅ Manual set selection feature</li>
+            <li>✅ Batch processing optimization</li>
+            <li>✅ Enhanced validation system</li>
+            <li>✅ Improved user interface</li>
+        </ul>
+    </div>
+</div>
+<hr>
+<h2>📞 Contact Information</h2>
+<div class="info-grid">
+    <div>
+        <h3>🏢 Development Team</h3>
+        <p>
+            <strong>Project</strong>: OMR Evaluation System<br>
+            <strong>Developer</strong>: Your Name<br>
+            <strong>Institution</strong>: Your Institution<br>
+            <strong>Email</strong>: your.email@domain.com
+        </p>
+    </div>
+    <div>
+        <h3>🔗 Project Links</h3>
+        <ul>
+            <li><a href="https://your-app.streamlit.app" target="_blank">🌐 Live Demo</a></li>
+            <li><a href="#">💻 GitHub Repository</a></li>
+            <li><a href="mailto:support@your-domain.com">📧 Support Email</a></li>
+            <li><a href="#">📱 LinkedIn Profile</a></li>
+        </ul>
+    </div>
+</div>
+"""
+
+# The static sections below the intro, emitted as one HTML block instead of st.columns rows
+_SECTIONS_HTML = _SPECS_HTML + _SUPPORT_HTML + _VERSION_CONTACT_HTML
+
+@st.cache_resource
+def _feedback_executor() -> ThreadPoolExecutor:
+    """One worker pool per process for delivering feedback off the script thread"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="feedback")
+
+def _send_feedback(feedback_type, message, email):
+    """Deliver a feedback submission (runs on the feedback executor)"""
+    # In production, this would send email or store in database
+    # Only the type is logged; the message and email are personal data
+    logging.getLogger("omr").info("Feedback received: %s", feedback_type)
+
+def _log_delivery_failure(future):
+    """Log the traceback of a feedback delivery that raised"""
+    exc = future.exception()
+    if exc is not None:
+        logging.getLogger("omr").exception("Feedback delivery failed", exc_info=exc)
+
+def render(app):
+    """About and support page"""
+    st.title("ℹ️ About & Support")
+    st.markdown("Learn more about the OMR Evaluation System and get support")
+
+    # About section
+    st.markdown("""
+    ## 🎯 About OMR Evaluation System
+
+    The **OMR Evaluation System** is a comprehensive web application designed to automate the processing 
+    and scoring of Optical Mark Recognition (OMR) answer sheets. Built with modern web technologies, 
+    it provides educational institutions with a reliable, accurate, and user-friendly solution for 
+    exam evaluation.
+
+    ### ✨ Key Features
+    - **100% Accuracy** with manual set selection
+    - **Multi-format Support** for answer keys (Excel, CSV, JSON)
+    - **Batch Processing** capabilities for efficiency
+    - **Comprehensive Analytics** and reporting
+    - **Professional Export** options (JSON, CSV, Excel)
+    - **User-friendly Interface** with step-by-step guidance
+
+    ### 🎓 Perfect For
+    - **Schools & Colleges** - Academic exams and assessments
+    - **Training Centers** - Certification and skill evaluation
+    - **Corporate Training** - Employee assessments
+    - **Online Education** - Remote evaluation support
+
+    ### 🏗️ Technology Stack
+    - **Frontend**: Streamlit (Python web framework)
+    - **Backend**: Python with SQLAlchemy
+    - **Image Processing**: OpenCV and PIL
+    - **Data Analysis**: Pandas and NumPy
+    - **Deployment**: Streamlit Community Cloud
+    """)
+
+    # Specifications, support, version and contact information
+    st.html(_SECTIONS_HTML)
+
+    # Feedback form
+    st.markdown("---")
+    st.markdown("### 💬 Feedback & Suggestions")
+
+    _feedback_form()
+
+@st.fragment
+def _feedback_form():
+    """Feedback form; submitting it reruns only this fragment, not the static page"""
+    with st.form("feedback_form"):
+        feedback_type = st.selectbox("Feedback Type", _FEEDBACK_TYPES)
+
+        feedback_message = st.text_area(
+            "Your Message",
+            height=100,
+            placeholder="Share your thoughts, suggestions, or issues..."
+        )
+
+        contact_email = st.text_input(
+            "Your Email (optional)",
+            placeholder="your.email@example.com"
+        )
+
+        if st.form_submit_button("📨 Send Feedback", type="primary"):
+            if not feedback_message.strip():
+                st.error("❌ Please enter your feedback message.")
+                return
+
+            contact_email = contact_email.strip()
+            if contact_email and not _EMAIL_RE.match(contact_email):
+                st.error("❌ Please enter a valid email address or leave it blank.")
+                return
+
+            # Queue delivery so the rerun doesn't wait on it
+            future = _feedback_executor().submit(_send_feedback, feedback_type, feedback_message, contact_email)
+            future.add_done_callback(_log_delivery_failure)
+            st.toast("Thank you for your feedback! We'll review it and get back to you.", icon="✅")
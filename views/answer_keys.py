@@ -0,0 +1,194 @@
+"""
+Answer key upload page
+"""
+
+import streamlit as st
+import pandas as pd
+import io
+import re
+from datetime import datetime
+from typing import Dict
+
+from views.common import banner
+
+# A set letter with no letter on either side ("Set - A", "Answer_A") or one glued
+# to a standalone "Set" ("SetB", "set_c"); "Subset", "Asset" and "Data" don't match
+_SET_RE = re.compile(r'(?<![A-Z])([ABCD])(?![A-Z])|(?<![A-Z])SET[\s\-_]*([ABCD])(?![A-Z])', re.I)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _load_excel(file_bytes: bytes, name: str) -> Dict[str, pd.DataFrame]:
+    """Parse every sheet of an uploaded workbook (cached across reruns)"""
+    try:
+        # Rust-backed reader, handles both .xlsx and .xls
+        return pd.read_excel(io.BytesIO(file_bytes), sheet_name=None, engine="calamine")
+    except ImportError:
+        # python-calamine not installed - let pandas pick openpyxl/xlrd
+        return pd.read_excel(io.BytesIO(file_bytes), sheet_name=None)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _workbook_previews(file_bytes: bytes, name: str, rows: int = 10) -> tuple:
+    """Return the first rows and the (rows, columns) shape of every sheet"""
+    excel_data = _load_excel(file_bytes, name)
+    previews = {sheet_name: df.head(rows).copy() for sheet_name, df in excel_data.items()}
+    shapes = {sheet_name: df.shape for sheet_name, df in excel_data.items()}
+    return previews, shapes
+
+@st.cache_data(show_spinner=False)
+def _detect_sets(sheet_names: tuple) -> tuple:
+    """Map answer key sets (A-D) to the sheet names that contain them"""
+    set_mapping = {}
+
+    for sheet_name in sheet_names:
+        match = _SET_RE.search(sheet_name)
+        if match:
+            set_letter = (match.group(1) or match.group(2)).upper()
+            set_mapping.setdefault(set_letter, sheet_name)
+
+    return list(set_mapping), set_mapping
+
+def render(app):
+    """Upload answer keys page"""
+    st.title("🔑 Answer Key Management")
+    st.markdown("Upload and manage Excel answer keys with automatic set detection")
+
+    # Check prerequisites
+    if not st.session_state.current_exam:
+        banner("warning-banner", """
+            <h4>⚠️ No Active Exam Session</h4>
+            <p>Please create an exam session first before uploading answer keys.</p>
+        """)
+
+        if st.button("📋 Create Exam Session", type="primary"):
+            st.session_state.current_page = "📋 Create Exam Session"
+            st.rerun()
+        return
+
+    exam = st.session_state.current_exam
+
+    # Show current exam info
+    banner("success-banner", f"""
+        <h4>🎯 Current Exam: {exam['title']}</h4>
+        <p><strong>Exam ID:</strong> {exam['id']} | <strong>Questions:</strong> {exam['total_questions']} | <strong>Expected Sets:</strong> {', '.join(exam['expected_sets'])}</p>
+    """)
+
+    # File upload section
+    st.markdown("### 📤 Upload Answer Key File")
+
+    uploaded_file = st.file_uploader(
+        "Choose Excel answer key file",
+        type=['xlsx', 'xls'],
+        help="Upload your Excel file containing answer keys for different sets (Set A, Set B, etc.)",
+        accept_multiple_files=False
+    )
+
+    if uploaded_file is not None:
+        try:
+            # File info
+            file_size_mb = uploaded_file.size / (1024 * 1024)
+            st.info(f"📁 **File:** {uploaded_file.name} ({file_size_mb:.2f} MB)")
+
+            # Process the file
+            with st.spinner("📊 Analyzing answer key file..."):
+                # Only the small previews leave the cache; full sheets stay inside _load_excel
+                previews, shapes = _workbook_previews(uploaded_file.getvalue(), uploaded_file.name)
+
+            st.success(f"✅ File loaded successfully!")
+            st.write(f"📊 **Sheets found:** {', '.join(previews.keys())}")
+
+            # Detect available sets
+            detected_sets, set_mapping = _detect_sets(tuple(previews.keys()))
+
+            if detected_sets:
+                banner("success-banner", f"""
+                    <h4>🔑 Detected Answer Key Sets: {', '.join(detected_sets)}</h4>
+                """)
+
+                # Show set mapping
+                with st.expander("🔍 Set Mapping Details", expanded=True):
+                    for set_type, sheet_name in set_mapping.items():
+                        col1, col2, col3 = st.columns([1, 2, 2])
+                        with col1:
+                            st.write(f"**Set {set_type}**")
+                        with col2:
+                            st.write(f"→ Sheet: '{sheet_name}'")
+                        with col3:
+                            if sheet_name in shapes:
+                                st.write(f"({shapes[sheet_name][0]} rows)")
+
+            # Preview each sheet
+            st.markdown("### 👁️ Sheet Previews")
+
+            for sheet_name, preview in previews.items():
+                n_rows, n_cols = shapes[sheet_name]
+                with st.expander(f"📋 Preview: {sheet_name}"):
+                    col1, col2 = st.columns([2, 1])
+
+                    with col1:
+                        st.dataframe(preview, use_container_width=True)
+
+                    with col2:
+                        st.metric("📊 Rows", n_rows)
+                        st.metric("📊 Columns", n_cols)
+
+                        if n_cols >= 5:
+                            st.success("✅ 5-subject format detected")
+                        else:
+                            st.warning(f"⚠️ {n_cols} columns found")
+
+            # Processing options
+            st.markdown("### ⚙️ Processing Options")
+
+            col1, col2, col3 = st.columns(3)
+
+            with col1:
+                validate_structure = st.checkbox("Validate Answer Structure", value=True, help="Check answer key format and completeness")
+
+            with col2:
+                save_keys = st.checkbox("Save to Session", value=True, help="Store answer keys for OMR processing")
+
+            with col3:
+                show_warnings = st.checkbox("Show Detailed Warnings", value=False, help="Display detailed validation warnings")
+
+            # Process button
+            if st.button("🚀 Process Answer Keys", type="primary", use_container_width=True):
+                with st.status("🔄 Processing answer keys...", expanded=False) as status:
+                    validation_passed = len(detected_sets) > 0
+                    status.update(
+                        label="✅ Answer keys processed" if validation_passed else "❌ Answer key validation failed",
+                        state="complete" if validation_passed else "error"
+                    )
+
+                if validation_passed:
+                    st.success("✅ Answer keys processed and validated successfully!")
+
+                    # Store in session
+                    st.session_state.answer_keys = {
+                        'filename': uploaded_file.name,
+                        'available_sets': detected_sets,
+                        'set_mapping': set_mapping,
+                        'total_questions': exam['total_questions'],
+                        'processed_at': datetime.now().isoformat(),
+                        'exam_id': exam['id']
+                    }
+
+                    # Success metrics
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        st.metric("📋 Sets Processed", len(detected_sets))
+                    with col2:
+                        st.metric("❓ Questions per Set", exam['total_questions'])
+                    with col3:
+                        st.metric("📊 Subjects", 5)
+                    with col4:
+                        st.metric("✅ Validation", "Passed")
+
+                    st.info("🎯 **Ready to process OMR sheets!** Go to the 'Process OMR Sheets' section.")
+                    st.balloons()
+
+                else:
+                    st.error("❌ Answer key validation failed!")
+                    st.error("Please check your Excel file format and try again.")
+
+        except Exception as e:
+            st.error(f"❌ Error processing file: {str(e)}")
+            st.info("💡 **Tip:** Make sure your Excel file has sheets named 'Set - A', 'Set - B', etc.")
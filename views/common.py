@@ -0,0 +1,9 @@
+"""
+Shared rendering helpers for the page modules
+"""
+
+import streamlit as st
+
+def banner(cls: str, body_html: str):
+    """Render a styled HTML block (card/banner) without the markdown parser"""
+    st.html(f'<div class="{cls}">{body_html}</div>')
@@ -0,0 +1,131 @@
+"""
+Create exam session page
+"""
+
+import streamlit as st
+from datetime import datetime
+
+def render(app):
+    """Create exam page"""
+    st.title("📋 Create New Exam Session")
+    st.markdown("Set up a comprehensive exam with all parameters and configurations")
+
+    with st.form("create_exam_form", clear_on_submit=True):
+        st.markdown("### 📝 Basic Information")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            exam_title = st.text_input(
+                "Exam Title *", 
+                value="Data Science Comprehensive Exam",
+                help="Enter a descriptive title for your exam"
+            )
+
+            exam_date = st.date_input(
+                "Exam Date *", 
+                value=datetime.now().date(),
+                help="Select the date when the exam was conducted"
+            )
+
+            duration = st.number_input(
+                "Duration (minutes)", 
+                value=120, 
+                min_value=30, 
+                max_value=300, 
+                step=15,
+                help="Total exam duration in minutes"
+            )
+
+        with col2:
+            exam_description = st.text_area(
+                "Description", 
+                value="Comprehensive exam covering Python, Data Analysis, MySQL, Power BI, and Advanced Statistics",
+                height=100,
+                help="Brief description of the exam content and scope"
+            )
+
+            total_questions = st.number_input(
+                "Total Questions", 
+                value=100, 
+                min_value=20, 
+                max_value=200, 
+                step=5,
+                help="Total number of questions in the exam"
+            )
+
+            expected_sets = st.multiselect(
+                "Expected Question Sets", 
+                ['A', 'B', 'C', 'D'], 
+                default=['A', 'B'],
+                help="Which question sets do you expect to have answer keys for?"
+            )
+
+        st.markdown("### 📚 Subject Configuration")
+
+        # Subject configuration
+        subjects_col1, subjects_col2 = st.columns(2)
+
+        with subjects_col1:
+            python_q = st.number_input("Python Questions", value=20, min_value=0, max_value=50)
+            data_analysis_q = st.number_input("Data Analysis Questions", value=20, min_value=0, max_value=50)
+            mysql_q = st.number_input("MySQL Questions", value=20, min_value=0, max_value=50)
+
+        with subjects_col2:
+            powerbi_q = st.number_input("Power BI Questions", value=20, min_value=0, max_value=50)
+            stats_q = st.number_input("Advanced Statistics Questions", value=20, min_value=0, max_value=50)
+
+        st.markdown("---")
+
+        # Submit button
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            submitted = st.form_submit_button("🚀 Create Exam Session", type="primary", use_container_width=True)
+
+        if submitted:
+            # Validate total
+            total_configured = sum((python_q, data_analysis_q, mysql_q, powerbi_q, stats_q))
+
+            if not exam_title.strip():
+                st.error("❌ Exam title is required!")
+            elif total_configured != total_questions:
+                st.error(f"❌ Subject question counts ({total_configured}) must match total questions ({total_questions})!")
+            else:
+                # Create exam session
+                now = datetime.now()
+                exam_data = {
+                    'id': f"EXAM_{now.strftime('%Y%m%d_%H%M%S')}",
+                    'title': exam_title.strip(),
+                    'date': exam_date,
+                    'duration': duration,
+                    'description': exam_description.strip(),
+                    'total_questions': total_questions,
+                    'expected_sets': expected_sets,
+                    'subject_config': {
+                        'PYTHON': python_q,
+                        'DATA_ANALYSIS': data_analysis_q,
+                        'MySQL': mysql_q,
+                        'POWER_BI': powerbi_q,
+                        'ADV_STATS': stats_q
+                    },
+                    'created_at': now.isoformat()
+                }
+
+                st.session_state.current_exam = exam_data
+
+                st.success("✅ Exam session created successfully!")
+                st.info("🔑 **Next Step:** Upload answer keys for this exam")
+
+                # Show exam summary
+                with st.expander("📋 Exam Summary", expanded=True):
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.write(f"**Exam ID:** {exam_data['id']}")
+                        st.write(f"**Title:** {exam_data['title']}")
+                        st.write(f"**Date:** {exam_data['date']}")
+                    with col2:
+                        st.write(f"**Duration:** {exam_data['duration']} minutes")
+                        st.write(f"**Questions:** {exam_data['total_questions']}")
+                        st.write(f"**Expected Sets:** {', '.join(exam_data['expected_sets'])}")
+
+                st.balloons()
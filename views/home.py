@@ -0,0 +1,128 @@
+"""
+Home & overview page
+"""
+
+import streamlit as st
+
+from views.common import banner
+
+# The static part of the page, joined once at import and sent as a single element
+_HERO_HTML = """
+<div class="main-header">
+    <h1>🎯 OMR Evaluation System</h1>
+    <h3>Automated Optical Mark Recognition with 100% Accuracy</h3>
+    <p>Professional OMR processing for educational institutions worldwide</p>
+</div>
+"""
+
+_FEATURES_HTML = """
+<div class="features-grid">
+    <div class="feature-card">
+        <h4>🔑 Smart Answer Key Management</h4>
+        <p>Upload Excel files once, detect multiple sets automatically. Support for A, B, C, D question sets with validation.</p>
+        <ul>
+            <li>Excel/CSV format support</li>
+            <li>Automatic set detection</li>
+            <li>Structure validation</li>
+            <li>Error reporting</li>
+        </ul>
+    </div>
+    <div class="feature-card">
+        <h4>📤 Intelligent OMR Processing</h4>
+        <p>Manual set selection ensures 100% accuracy. No guesswork, complete control over answer key usage.</p>
+        <ul>
+            <li>Manual set selection</li>
+            <li>Batch processing</li>
+            <li>Real-time preview</li>
+            <li>Quality validation</li>
+        </ul>
+    </div>
+    <div class="feature-card">
+        <h4>📊 Comprehensive Analytics</h4>
+        <p>Detailed results with subject-wise analysis, performance metrics, and professional export options.</p>
+        <ul>
+            <li>Subject-wise breakdown</li>
+            <li>Performance analytics</li>
+            <li>Export to JSON/CSV/Excel</li>
+            <li>Historical tracking</li>
+        </ul>
+    </div>
+</div>
+"""
+
+_WORKFLOW_HTML = """
+<h2>🔄 <strong>Simple 3-Step Workflow</strong></h2>
+<div class="features-grid">
+    <div class="info-banner">
+        <strong>Step 1: Setup Once</strong><br><br>
+        📋 Create exam session<br>
+        🔑 Upload answer key Excel file<br>
+        ✅ System detects available sets<br>
+        📊 Ready for processing
+    </div>
+    <div class="success-banner">
+        <strong>Step 2: Process OMR Sheets</strong><br><br>
+        📤 Upload OMR images<br>
+        🎯 Select set for each sheet<br>
+        ⚡ Instant processing<br>
+        📈 Real-time results
+    </div>
+    <div class="warning-banner">
+        <strong>Step 3: Analyze &amp; Export</strong><br><br>
+        📊 View detailed analytics<br>
+        📥 Download comprehensive reports<br>
+        🔍 Historical performance tracking<br>
+        📈 Subject-wise insights
+    </div>
+</div>
+"""
+
+_METRICS_HTML = """
+<h2>📈 <strong>System Performance</strong></h2>
+<div class="metrics-grid">
+    <div class="metric-card">
+        <h3>⚡ Speed</h3>
+        <h2>&lt; 3 sec</h2>
+        <p>Per OMR sheet</p>
+    </div>
+    <div class="metric-card">
+        <h3>🎯 Accuracy</h3>
+        <h2>100%</h2>
+        <p>With manual selection</p>
+    </div>
+    <div class="metric-card">
+        <h3>📊 Capacity</h3>
+        <h2>3000+</h2>
+        <p>Sheets per day</p>
+    </div>
+    <div class="metric-card">
+        <h3>🔧 Reliability</h3>
+        <h2>99.9%</h2>
+        <p>Uptime guarantee</p>
+    </div>
+</div>
+"""
+
+_HOME_HTML = _HERO_HTML + _FEATURES_HTML + _WORKFLOW_HTML + _METRICS_HTML
+
+def render(app):
+    """Enhanced home page for production"""
+    # Hero, features, workflow and performance metrics
+    st.html(_HOME_HTML)
+
+    # Getting started
+    if not st.session_state.current_exam:
+        st.markdown("## 🚀 **Ready to Get Started?**")
+
+        col1, col2 = st.columns([1, 2])
+
+        with col1:
+            if st.button("📋 Create Your First Exam", type="primary", use_container_width=True):
+                st.session_state.current_page = "📋 Create Exam Session"
+                st.rerun()
+
+        with col2:
+            banner("success-banner", """
+                <strong>🎓 Perfect for Educational Institutions</strong><br>
+                Schools, Colleges, Training Centers, Certification Bodies
+            """)
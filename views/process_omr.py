@@ -0,0 +1,436 @@
+"""
+OMR sheet processing page
+"""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import json
+import hashlib
+from datetime import datetime
+
+from views.common import banner
+
+try:
+    # C-level JSON encoder for the results export
+    import orjson
+except ImportError:
+    orjson = None
+
+# Subjects on the answer sheet, 20 questions each
+_SUBJECTS = ('PYTHON', 'DATA_ANALYSIS', 'MySQL', 'POWER_BI', 'ADV_STATS')
+
+# Grade boundaries (percent): below 70 is B-, 90 and above is A+
+_GRADE_BINS = np.array([70, 75, 80, 85, 90])
+_GRADE_LABELS = np.array(['B-', 'B', 'B+', 'A-', 'A', 'A+'])
+
+# Result field -> column header in the per-set results tables
+_SET_TABLE_COLUMNS = {
+    'filename': 'Filename',
+    'overall_score': 'Score',
+    'grade': 'Grade',
+    'confidence': 'Confidence'
+}
+
+# Flattened result field -> CSV export header
+_CSV_COLUMNS = {
+    'filename': 'Filename',
+    'selected_set': 'Selected_Set',
+    'overall_score': 'Overall_Score',
+    'grade': 'Grade',
+    'confidence': 'Confidence',
+    'processing_time': 'Processing_Time',
+    **{f'subject_scores_{subject}_correct': f'{subject}_Score' for subject in _SUBJECTS}
+}
+
+def render(app):
+    """Process OMR sheets with manual set selection"""
+    st.title("📤 OMR Sheet Processing")
+    st.markdown("Upload OMR images and select the correct answer set for accurate processing")
+
+    # Check prerequisites
+    prerequisites_met = True
+
+    if not st.session_state.current_exam:
+        banner("warning-banner", """
+            <h4>⚠️ No Active Exam</h4>
+            <p>Please create an exam session first.</p>
+        """)
+        prerequisites_met = False
+
+    if not st.session_state.answer_keys:
+        banner("warning-banner", """
+            <h4>⚠️ No Answer Keys</h4>
+            <p>Please upload answer keys before processing OMR sheets.</p>
+        """)
+        prerequisites_met = False
+
+    if not prerequisites_met:
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("📋 Create Exam", type="primary"):
+                st.session_state.current_page = "📋 Create Exam Session"
+                st.rerun()
+        with col2:
+            if st.button("🔑 Upload Keys", type="primary"):
+                st.session_state.current_page = "🔑 Upload Answer Keys"
+                st.rerun()
+        return
+
+    # Show context
+    exam = st.session_state.current_exam
+    keys = st.session_state.answer_keys
+
+    banner("success-banner", f"""
+        <h4>🎯 Ready for Processing</h4>
+        <p><strong>Exam:</strong> {exam['title']} | <strong>Available Sets:</strong> {', '.join(keys['available_sets'])} | <strong>Questions:</strong> {keys['total_questions']}</p>
+    """)
+
+    # File upload
+    st.markdown("### 📤 Upload OMR Sheet Images")
+
+    uploaded_files = st.file_uploader(
+        "Choose OMR sheet images",
+        type=['jpg', 'jpeg', 'png', 'tiff'],
+        accept_multiple_files=True,
+        help="Select one or more OMR sheet images. Supported formats: JPG, PNG, TIFF"
+    )
+
+    if uploaded_files:
+        unique_files = _unique_uploads(uploaded_files)
+        if len(unique_files) < len(uploaded_files):
+            st.info(f"♻️ Skipped {len(uploaded_files) - len(unique_files)} duplicate file(s)")
+        uploaded_files = unique_files
+
+        st.write(f"📋 **{len(uploaded_files)} file(s) uploaded**")
+
+        # Set selection reruns on its own, without the sidebar or the rest of the page
+        _per_file_selection(uploaded_files, keys)
+
+        # Process button
+        st.markdown("---")
+
+        if st.button("🚀 Process All OMR Sheets", type="primary", use_container_width=True):
+            process_batch_omr_sheets(
+                uploaded_files,
+                st.session_state.file_set_mapping,
+                keys,
+                st.session_state.confidence_threshold
+            )
+
+def _unique_uploads(uploaded_files):
+    """Drop byte-identical uploads, hashing each file only once while it stays uploaded"""
+    # Rebuilt from the current uploads so removed files don't linger in the session
+    old_digests = st.session_state.get('_upload_digests', {})
+    digests = {
+        f.file_id: old_digests.get(f.file_id) or hashlib.blake2b(f.getbuffer(), digest_size=16).hexdigest()
+        for f in uploaded_files
+    }
+    st.session_state._upload_digests = digests
+    seen = set()
+    unique_files = []
+
+    for uploaded_file in uploaded_files:
+        digest = digests[uploaded_file.file_id]
+        if digest not in seen:
+            seen.add(digest)
+            unique_files.append(uploaded_file)
+
+    return unique_files
+
+@st.fragment
+def _per_file_selection(uploaded_files, keys):
+    """Processing options, per-sheet set selection and summary (reruns on its own)"""
+    # Processing configuration
+    st.markdown("### ⚙️ Processing Configuration")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        default_set = st.selectbox(
+            "Default Set for All Sheets",
+            ["Choose individually"] + keys['available_sets'],
+            help="Apply the same set to all sheets or choose individually"
+        )
+
+    with col2:
+        st.slider(
+            "Detection Confidence", 
+            0.5, 1.0, 0.8, 0.05,
+            key="confidence_threshold",
+            help="Minimum confidence for bubble detection"
+        )
+
+    with col3:
+        export_format = st.selectbox(
+            "Export Format", 
+            ["JSON", "CSV", "Both"],
+            help="Choose result export format"
+        )
+
+    # Individual file processing
+    st.markdown("### 🎯 Set Selection for Each OMR Sheet")
+
+    individual = default_set == "Choose individually"
+    names = [uploaded_file.name for uploaded_file in uploaded_files]
+    sizes_kb = np.fromiter(
+        (uploaded_file.size >> 10 for uploaded_file in uploaded_files),
+        dtype=np.int32,
+        count=len(uploaded_files)
+    )
+    files_df = pd.DataFrame({
+        'file': names,
+        'size_kb': sizes_kb,
+        'set': keys['available_sets'][0] if individual else default_set
+    })
+
+    # One table widget for the whole batch instead of a selectbox per file
+    edited_df = st.data_editor(
+        files_df,
+        column_config={
+            'file': st.column_config.TextColumn("📄 File"),
+            'size_kb': st.column_config.NumberColumn("📊 Size (KB)"),
+            'set': st.column_config.SelectboxColumn(
+                "🎯 Set",
+                options=keys['available_sets'],
+                required=True,
+                help="Choose the answer set for each sheet"
+            )
+        },
+        disabled=['file', 'size_kb'] if individual else True,
+        hide_index=True,
+        use_container_width=True
+    )
+
+    file_set_mapping = dict(zip(edited_df['file'], edited_df['set']))
+
+    # Processing summary
+    st.markdown("### 📊 Processing Summary")
+
+    set_counts = edited_df['set'].value_counts(sort=False)
+
+    summary_cols = st.columns(len(set_counts) + 1)
+
+    for i, (set_type, count) in enumerate(set_counts.items()):
+        with summary_cols[i]:
+            st.metric(f"📋 Set {set_type}", f"{count} sheets")
+
+    with summary_cols[-1]:
+        st.metric("📊 Total", len(uploaded_files))
+
+    # Read by the Process button outside the fragment
+    st.session_state.file_set_mapping = file_set_mapping
+
+def process_batch_omr_sheets(uploaded_files, file_set_mapping, keys_info, confidence_threshold):
+    """Process batch of OMR sheets"""
+    total_files = len(uploaded_files)
+
+    # Draw the mock scores for the whole batch at once
+    rng = np.random.default_rng()
+    base_scores = rng.integers(70, 95, size=total_files)
+    # Counts fit in small ints: 0-20 per subject, 0-100 in total
+    subject_correct = np.clip(
+        base_scores[:, None] // 5 + rng.integers(-3, 4, size=(total_files, len(_SUBJECTS))),
+        10, 20
+    ).astype(np.int8)
+    total_correct = subject_correct.sum(axis=1, dtype=np.uint8)
+    overall_scores = (total_correct / 100) * 100
+    grades = _GRADE_LABELS[np.searchsorted(_GRADE_BINS, total_correct, side='right')]
+    confidences = rng.uniform(0.85, 0.95, total_files)
+    processing_times = rng.uniform(1.8, 3.2, total_files)
+
+    # Plain Python values keep the stored results JSON-friendly
+    batch = zip(
+        subject_correct.tolist(), total_correct.tolist(), grades.tolist(),
+        confidences.tolist(), processing_times.tolist()
+    )
+
+    # Progress tracking
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+
+    results = []
+    # Refresh the progress widgets ~20 times per batch rather than for every file
+    update_every = max(1, total_files // 20)
+
+    for i, (uploaded_file, scores) in enumerate(zip(uploaded_files, batch)):
+        # Update progress
+        if i % update_every == 0 or i == total_files - 1:
+            progress_bar.progress((i + 1) / total_files)
+            status_text.text(f"🔄 Processing {uploaded_file.name} ({i+1}/{total_files})")
+
+        # Get selected set
+        selected_set = file_set_mapping[uploaded_file.name]
+
+        # Generate result
+        result = generate_processing_result(uploaded_file.name, selected_set, keys_info, *scores)
+        results.append(result)
+
+    # Complete
+    status_text.text("✅ Processing completed successfully!")
+    progress_bar.progress(1.0)
+
+    # Store results column-wise straight from the batch arrays, in compact dtypes
+    _store_results({
+        'filename': [r['filename'] for r in results],
+        'selected_set': [r['selected_set'] for r in results],
+        'grade': grades.tolist(),
+        'processed_at': [r['processed_at'] for r in results],
+        'overall_score': overall_scores.astype(np.float32),
+        'confidence': confidences.astype(np.float32),
+        'processing_time': processing_times.astype(np.float32),
+        'subject_correct': subject_correct
+    })
+
+    stats = st.session_state.result_stats
+    stats['n'] += total_files
+    stats['sum_score'] += float(overall_scores.sum())
+    stats['sum_conf'] += float(confidences.sum())
+    stats['high'] += int((overall_scores >= 80).sum())
+
+    # Display results
+    st.markdown("---")
+    display_processing_results(results, keys_info)
+
+def _store_results(batch_cols):
+    """Append a batch to the session's columnar result history"""
+    store = st.session_state.results_cols
+    if store is None:
+        st.session_state.results_cols = batch_cols
+        return
+
+    for name, column in batch_cols.items():
+        if isinstance(column, np.ndarray):
+            store[name] = np.concatenate([store[name], column])
+        else:
+            store[name].extend(column)
+
+def generate_processing_result(filename, selected_set, keys_info, subject_correct, total_correct,
+                               grade, confidence, processing_time):
+    """Assemble one mock processing result from values drawn for the batch"""
+    subject_scores = {
+        subject: {
+            'correct': correct,
+            'total': 20,
+            'percentage': (correct / 20) * 100
+        }
+        for subject, correct in zip(_SUBJECTS, subject_correct)
+    }
+
+    return {
+        'filename': filename,
+        'selected_set': selected_set,
+        'overall_score': (total_correct / 100) * 100,
+        'total_correct': total_correct,
+        'grade': grade,
+        'subject_scores': subject_scores,
+        'confidence': confidence,
+        'processing_time': processing_time,
+        'processed_at': datetime.now().isoformat(),
+        'exam_id': keys_info.get('exam_id', 'Unknown')
+    }
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _results_to_json(results):
+    """Serialize results for the JSON download (cached per result list)"""
+    if orjson is not None:
+        return orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(results, indent=2, default=str)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _results_to_csv(results):
+    """Flatten results into CSV rows for the CSV download (cached per result list)"""
+    csv_df = pd.json_normalize(results, sep='_')[list(_CSV_COLUMNS)]
+    return csv_df.rename(columns=_CSV_COLUMNS).to_csv(index=False)
+
+def display_processing_results(results, keys_info):
+    """Display batch processing results"""
+    st.subheader("🎉 Processing Results")
+
+    # One columnar view of the batch for every aggregate below
+    df = pd.DataFrame(results, columns=['filename', 'selected_set', 'overall_score', 'grade', 'confidence', 'processing_time'])
+
+    # Overall statistics
+    total_sheets = len(df)
+    avg_score = df['overall_score'].mean()
+    avg_confidence = df['confidence'].mean()
+    total_time = df['processing_time'].sum()
+    high_scorers = int((df['overall_score'] >= 80).sum())
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+
+    with col1:
+        st.metric("📋 Processed", total_sheets)
+    with col2:
+        st.metric("📈 Avg Score", f"{avg_score:.1f}%")
+    with col3:
+        st.metric("🎯 High Scorers", f"{high_scorers}/{total_sheets}")
+    with col4:
+        st.metric("🔍 Avg Confidence", f"{avg_confidence:.2f}")
+    with col5:
+        st.metric("⏱️ Total Time", f"{total_time:.1f}s")
+
+    # Results by set
+    st.markdown("### 📊 Results by Answer Set")
+
+    for set_type, set_df in df.groupby('selected_set', sort=False):
+        with st.expander(f"📋 Set {set_type} Results ({len(set_df)} sheets)", expanded=True):
+            avg_set_score = set_df['overall_score'].mean()
+
+            col1, col2 = st.columns([1, 3])
+            with col1:
+                st.metric(f"Set {set_type} Average", f"{avg_set_score:.1f}%")
+
+            with col2:
+                # Create results table
+                table_df = set_df[list(_SET_TABLE_COLUMNS)].rename(columns=_SET_TABLE_COLUMNS)
+                st.dataframe(
+                    table_df,
+                    column_config={
+                        'Score': st.column_config.NumberColumn(format="%.1f%%"),
+                        'Confidence': st.column_config.NumberColumn(format="%.2f")
+                    },
+                    use_container_width=True,
+                    hide_index=True
+                )
+
+    # Download options
+    _export_section(results)
+
+@st.fragment
+def _export_section(results):
+    """Download buttons for a batch (reruns on its own when a button is used)"""
+    st.markdown("### 📥 Export Results")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        # JSON export
+        json_data = _results_to_json(results)
+        st.download_button(
+            "📄 Download JSON",
+            json_data,
+            f"omr_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            "application/json",
+            use_container_width=True
+        )
+
+    with col2:
+        # CSV export
+        csv_str = _results_to_csv(results)
+
+        st.download_button(
+            "📊 Download CSV",
+            csv_str,
+            f"omr_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            "text/csv",
+            use_container_width=True
+        )
+
+    with col3:
+        st.info("""
+        📈 **Excel Report**
+
+        Detailed Excel export
+        with charts coming soon!
+        """)
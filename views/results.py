@@ -0,0 +1,137 @@
+"""
+Results & analytics page
+"""
+
+import streamlit as st
+import pandas as pd
+
+from views.common import banner
+
+# Grades best-first, the order the distribution is listed in
+_GRADE_ORDER = ['A+', 'A', 'A-', 'B+', 'B', 'B-']
+
+def _stat_cards_html(total_processed, avg_score, high_scorers, avg_confidence):
+    """Headline metric cards as one HTML grid"""
+    return f"""
+<div class="metrics-grid">
+    <div class="metric-card">
+        <h4>📋 Total Processed</h4>
+        <h2>{total_processed}</h2>
+        <p>OMR Sheets</p>
+    </div>
+    <div class="metric-card">
+        <h4>📈 Average Score</h4>
+        <h2>{avg_score:.1f}%</h2>
+        <p>Overall Performance</p>
+    </div>
+    <div class="metric-card">
+        <h4>🎯 High Performers</h4>
+        <h2>{high_scorers}/{total_processed}</h2>
+        <p>Score ≥ 80%</p>
+    </div>
+    <div class="metric-card">
+        <h4>🔍 Avg Confidence</h4>
+        <h2>{avg_confidence:.2f}</h2>
+        <p>Detection Quality</p>
+    </div>
+</div>
+"""
+
+def render(app):
+    """View historical results and analytics"""
+    st.title("📊 Results & Analytics")
+    st.markdown("Comprehensive analysis of processed OMR sheets and performance trends")
+
+    if st.session_state.results_cols is None:
+        banner("warning-banner", """
+            <h4>📋 No Results Available</h4>
+            <p>No OMR sheets have been processed yet. Process some sheets first to see analytics here.</p>
+        """)
+
+        if st.button("📤 Go to OMR Processing", type="primary"):
+            st.session_state.current_page = "📤 Process OMR Sheets"
+            st.rerun()
+        return
+
+    results = st.session_state.results_cols
+
+    # Overall statistics
+    st.markdown("### 📈 Overall Performance Statistics")
+
+    # Headline numbers come from the running totals, not a scan of the history
+    stats = st.session_state.result_stats
+    total_processed = stats['n']
+    avg_score = stats['sum_score'] / total_processed
+    high_scorers = stats['high']
+    avg_confidence = stats['sum_conf'] / total_processed
+
+    st.html(_stat_cards_html(total_processed, avg_score, high_scorers, avg_confidence))
+
+    # Results table
+    st.markdown("### 📄 Detailed Results")
+
+    # Only the selected page of the history is turned into a table
+    page_col1, page_col2 = st.columns(2)
+
+    with page_col1:
+        page_size = st.selectbox("Rows per page", [25, 50, 100, 500], index=1)
+
+    total_pages = max(1, (total_processed + page_size - 1) // page_size)
+
+    with page_col2:
+        page = st.number_input("Page", min_value=1, max_value=total_pages, value=1, step=1)
+
+    page_slice = slice((page - 1) * page_size, page * page_size)
+
+    # Create comprehensive table
+    table_df = pd.DataFrame({
+        'Filename': results['filename'][page_slice],
+        'Set': results['selected_set'][page_slice],
+        'Score': results['overall_score'][page_slice],
+        'Grade': results['grade'][page_slice],
+        'Confidence': results['confidence'][page_slice],
+        'Processed': pd.to_datetime(results['processed_at'][page_slice])
+    })
+    st.dataframe(
+        table_df,
+        column_config={
+            'Score': st.column_config.NumberColumn(format="%.1f%%"),
+            'Confidence': st.column_config.NumberColumn(format="%.2f"),
+            'Processed': st.column_config.DatetimeColumn(format="YYYY-MM-DD HH:mm")
+        },
+        use_container_width=True,
+        hide_index=True
+    )
+    st.caption(f"Showing {page_slice.start + 1}-{page_slice.start + len(table_df)} of {total_processed} results (page {page} of {total_pages})")
+
+    # Set-wise analysis
+    st.markdown("### 📊 Performance Analysis by Set")
+
+    df = pd.DataFrame({key: results[key] for key in ('selected_set', 'overall_score', 'grade')})
+
+    set_analysis = df.groupby('selected_set', sort=False)['overall_score'].agg(sheets='count', average='mean')
+    grade_table = (
+        df.groupby(['selected_set', 'grade']).size()
+        .unstack(fill_value=0)
+        .reindex(columns=_GRADE_ORDER, fill_value=0)
+    )
+
+    analysis_cols = st.columns(len(set_analysis))
+
+    for i, data in enumerate(set_analysis.itertuples()):
+        set_type = data.Index
+        with analysis_cols[i]:
+            banner("feature-card", f"""
+                <h4>📋 Set {set_type}</h4>
+                <p><strong>Sheets:</strong> {data.sheets}</p>
+                <p><strong>Average:</strong> {data.average:.1f}%</p>
+            """)
+
+            # Grade distribution
+            grade_counts = grade_table.loc[set_type]
+            grade_counts = grade_counts[grade_counts > 0]
+
+            st.write("**Grade Distribution:**")
+            for grade, count in grade_counts.items():
+                percentage = (count / data.sheets) * 100
+                st.write(f"• {grade}: {count} ({percentage:.0f}%)")
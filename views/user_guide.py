@@ -0,0 +1,278 @@
+"""
+User guide page
+"""
+
+import streamlit as st
+
+# Section title -> guide text, in table-of-contents order
+_GUIDE = {
+    "🚀 Getting Started": """
+    ## 🚀 Getting Started
+
+    Welcome to the OMR Evaluation System! Follow these steps to get started:
+
+    ### Step 1: Create Your First Exam
+    1. Go to **"📋 Create Exam Session"**
+    2. Fill in exam details (title, date, duration)
+    3. Configure subjects and question counts
+    4. Click "Create Exam Session"
+
+    ### Step 2: Upload Answer Keys
+    1. Go to **"🔑 Upload Answer Keys"**  
+    2. Upload your Excel file with answer keys
+    3. System will automatically detect available sets
+    4. Verify the detected sets and proceed
+
+    ### Step 3: Process OMR Sheets
+    1. Go to **"📤 Process OMR Sheets"**
+    2. Upload OMR images (JPG, PNG, TIFF)
+    3. Select the correct set for each sheet
+    4. Click "Process All OMR Sheets"
+
+    ### Step 4: View Results
+    1. Go to **"📊 View Results & Analytics"**
+    2. Analyze performance and export data
+    3. Download reports in JSON/CSV format
+    """,
+    "📋 Creating Exam Sessions": """
+    ## 📋 Creating Exam Sessions
+
+    ### Exam Information
+    - **Title**: Descriptive name for your exam
+    - **Date**: When the exam was conducted
+    - **Duration**: Total time allowed (in minutes)
+    - **Description**: Brief overview of exam content
+
+    ### Question Configuration
+    - **Total Questions**: Usually 100 questions
+    - **Subject Breakdown**: 
+      - Python: 20 questions (Q1-Q20)
+      - Data Analysis: 20 questions (Q21-Q40)
+      - MySQL: 20 questions (Q41-Q60)
+      - Power BI: 20 questions (Q61-Q80)
+      - Advanced Statistics: 20 questions (Q81-Q100)
+
+    ### Expected Sets
+    Select which question sets you plan to have:
+    - **Set A**: Most common
+    - **Set B**: Alternative version
+    - **Set C & D**: Additional variants if needed
+
+    ### Tips
+    - Make sure subject questions add up to total questions
+    - Use descriptive exam titles for easy identification
+    - Configure expected sets based on your answer key files
+    """,
+    "🔑 Managing Answer Keys": """
+    ## 🔑 Managing Answer Keys
+
+    ### Excel File Format
+    Your Excel file should have separate sheets for each set:
+    - **Sheet Name**: "Set - A", "Set - B", etc.
+    - **Columns**: 5 columns for 5 subjects
+    - **Rows**: Question-answer pairs like "1 - a", "21 - a"
+
+    ### Supported Answer Formats
+    - Single answers: "a", "b", "c", "d"
+    - Multiple answers: "a,b", "a,b,c,d"
+    - All correct: "a,b,c,d"
+
+    ### File Requirements
+    - **Format**: Excel (.xlsx) or CSV (.csv)
+    - **Size**: Maximum 10MB
+    - **Structure**: Consistent format across all sets
+
+    ### Validation Process
+    The system automatically:
+    1. Detects available sets from sheet names
+    2. Validates answer format and completeness
+    3. Checks question numbering (1-100)
+    4. Verifies subject distribution
+
+    ### Best Practices
+    - Use consistent sheet naming ("Set - A", "Set - B")
+    - Double-check answer accuracy before upload
+    - Test with sample data first
+    - Keep backup copies of answer key files
+    """,
+    "📤 Processing OMR Sheets": """
+    ## 📤 Processing OMR Sheets
+
+    ### Image Requirements
+    - **Formats**: JPG, PNG, TIFF
+    - **Quality**: High resolution, clear bubble marks
+    - **Size**: Maximum 10MB per image
+    - **Orientation**: Properly aligned OMR sheets
+
+    ### Set Selection Options
+    1. **Choose Individually**: Select set for each sheet separately
+    2. **Default Set**: Apply same set to all uploaded sheets
+
+    ### Processing Configuration
+    - **Confidence Threshold**: 0.8 recommended (80% confidence)
+    - **Export Format**: Choose JSON, CSV, or both
+
+    ### Batch Processing
+    - Upload multiple files at once
+    - Select appropriate sets for each
+    - Monitor processing progress
+    - View results immediately
+
+    ### Quality Assurance
+    The system provides:
+    - Confidence scores for each detection
+    - Processing time metrics
+    - Error flagging for manual review
+    - Detailed validation results
+
+    ### Tips for Best Results
+    - Ensure good image quality and lighting
+    - Check that bubbles are clearly marked
+    - Verify correct set selection for each sheet
+    - Review low-confidence results manually
+    """,
+    "📊 Understanding Results": """
+    ## 📊 Understanding Results
+
+    ### Score Components
+    - **Overall Score**: Total correct answers out of 100
+    - **Percentage**: Overall score as percentage
+    - **Grade**: Letter grade (A+, A, A-, B+, B, B-)
+    - **Subject Scores**: Individual subject performance
+
+    ### Quality Metrics  
+    - **Confidence Score**: Detection reliability (0.0-1.0)
+    - **Processing Time**: Time taken per sheet
+    - **Set Used**: Which answer key was applied
+
+    ### Subject Analysis
+    Each subject shows:
+    - Correct answers out of 20
+    - Subject percentage
+    - Individual question results
+
+    ### Export Options
+    1. **JSON Format**: Complete data with all details
+    2. **CSV Format**: Tabular data for spreadsheet analysis  
+    3. **Excel Format**: Professional reports (coming soon)
+
+    ### Analytics Dashboard
+    - Overall performance statistics
+    - Set-wise comparison
+    - Grade distribution
+    - Historical trends
+    - High performer identification
+
+    ### Interpreting Confidence Scores
+    - **> 0.9**: Excellent detection, high reliability
+    - **0.8-0.9**: Good detection, recommended threshold  
+    - **0.7-0.8**: Acceptable, may need review
+    - **< 0.7**: Low confidence, manual review recommended
+    """,
+    "💡 Best Practices": """
+    ## 💡 Best Practices
+
+    ### Before Processing
+    1. **Prepare Answer Keys**
+       - Double-check all answers for accuracy
+       - Use consistent Excel format
+       - Test with sample sheets first
+
+    2. **OMR Sheet Quality**
+       - Ensure clear, dark bubble marks
+       - Scan at high resolution (300+ DPI)
+       - Check for proper alignment
+       - Remove any stray marks
+
+    ### During Processing
+    1. **Set Selection**
+       - Verify correct set for each sheet
+       - Use batch processing for efficiency
+       - Double-check set assignments
+
+    2. **Quality Control**
+       - Monitor confidence scores
+       - Flag low-confidence results
+       - Review unusual score patterns
+
+    ### After Processing
+    1. **Result Verification**
+       - Spot-check high/low scores
+       - Verify subject-wise performance
+       - Cross-reference with manual grades
+
+    2. **Data Management**
+       - Export results regularly
+       - Maintain backup copies
+       - Track processing history
+
+    ### Workflow Optimization
+    - Process sheets in batches of 20-50
+    - Use consistent naming conventions
+    - Maintain organized file structure
+    - Regular system maintenance and cleanup
+    """,
+    "🔧 Troubleshooting": """
+    ## 🔧 Troubleshooting
+
+    ### Common Issues & Solutions
+
+    #### 1. Answer Key Upload Problems
+    **Issue**: "No sets detected" error
+    - **Solution**: Check sheet names contain "A", "B", etc.
+    - **Example**: Use "Set - A", "Set - B" as sheet names
+
+    **Issue**: Validation errors  
+    - **Solution**: Verify answer format consistency
+    - **Check**: All answers are a, b, c, or d
+
+    #### 2. OMR Processing Issues
+    **Issue**: Low confidence scores
+    - **Solution**: Check image quality and clarity
+    - **Action**: Re-scan with better lighting
+
+    **Issue**: Incorrect results
+    - **Solution**: Verify correct set selection
+    - **Check**: Match OMR sheet set with answer key
+
+    #### 3. Performance Issues
+    **Issue**: Slow processing
+    - **Solution**: Process smaller batches (10-20 sheets)
+    - **Check**: Internet connection stability
+
+    **Issue**: Upload failures
+    - **Solution**: Check file size (max 10MB per file)
+    - **Action**: Compress images if needed
+
+    ### Error Messages
+    - **"No active exam"**: Create exam session first
+    - **"No answer keys"**: Upload answer keys before processing
+    - **"Invalid file format"**: Use JPG, PNG, or TIFF for images
+    - **"Validation failed"**: Check answer key format
+
+    ### Getting Help
+    - Check this user guide first
+    - Review error messages carefully  
+    - Contact support with specific error details
+    - Include screenshot and file details when reporting issues
+    """
+}
+
+def render(app):
+    """Comprehensive user guide"""
+    st.title("📖 User Guide")
+    st.markdown("Complete guide to using the OMR Evaluation System effectively")
+
+    # Table of contents
+    st.markdown("### 📋 Table of Contents")
+
+    _guide_section()
+
+@st.fragment
+def _guide_section():
+    """Section picker and the selected section; switching reruns only this fragment"""
+    selected_section = st.selectbox("Choose a section:", list(_GUIDE))
+
+    st.markdown("---")
+
+    st.markdown(_GUIDE[selected_section])